@@ -10,12 +10,14 @@ from .process_controller import ProcessController
 from .network_controller import NetworkController
 from .hardware_controller import HardwareController
 from .traffic_controller import TrafficMonitorController
+from .advanced_monitor_controller import AdvancedMonitorController
 
 __all__ = [
     'SystemMonitorController',
     'ProcessController',
     'NetworkController',
     'HardwareController',
-    'TrafficMonitorController'
+    'TrafficMonitorController',
+    'AdvancedMonitorController'
 ]
 
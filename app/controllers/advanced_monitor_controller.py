@@ -6,10 +6,16 @@
 """
 
 import psutil
-import platform
 from typing import Dict, List
 from PySide6.QtCore import QObject, Signal
 
+from app.utils import platform_info
+from app.utils.async_worker import AsyncWorkerManager
+
+# psutil传感器接口是否可用（取决于平台和psutil版本，导入时判断一次）
+_HAS_SENSORS_TEMPERATURES = hasattr(psutil, 'sensors_temperatures')
+_HAS_SENSORS_BATTERY = hasattr(psutil, 'sensors_battery')
+
 
 class AdvancedMonitorController(QObject):
     """高级监控控制器"""
@@ -20,133 +26,153 @@ class AdvancedMonitorController(QObject):
     services_updated = Signal(list)
     error_occurred = Signal(str)
 
-    def get_temperature_info(self) -> Dict:
-        """获取温度信息"""
-        try:
-            temp_info = {}
-
-            if hasattr(psutil, 'sensors_temperatures'):
-                temps = psutil.sensors_temperatures()
-
-                if temps:
-                    for name, entries in temps.items():
-                        temp_list = []
-                        for entry in entries:
-                            temp_data = {
-                                'label': entry.label or name,
-                                'current': entry.current,
-                                'high': entry.high,
-                                'critical': entry.critical
-                            }
-                            temp_list.append(temp_data)
-                        temp_info[name] = temp_list
-                else:
-                    temp_info['error'] = "未检测到温度传感器"
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.worker_manager = AsyncWorkerManager(self)
+
+    def get_temperature_info(self):
+        """获取温度信息（异步执行）"""
+        self.worker_manager.execute(
+            name='temperature',
+            target_func=self._fetch_temperature_info,
+            callback=self.temperature_updated.emit,
+            error_callback=lambda e: self.error_occurred.emit(f"获取温度信息失败: {e}")
+        )
+
+    def get_battery_info(self):
+        """获取电池信息（异步执行）"""
+        self.worker_manager.execute(
+            name='battery',
+            target_func=self._fetch_battery_info,
+            callback=self.battery_updated.emit,
+            error_callback=lambda e: self.error_occurred.emit(f"获取电池信息失败: {e}")
+        )
+
+    def get_services_info(self):
+        """获取Windows服务信息（异步执行）"""
+        self.worker_manager.execute(
+            name='services',
+            target_func=self._fetch_services_info,
+            callback=self.services_updated.emit,
+            error_callback=lambda e: self.error_occurred.emit(f"获取服务信息失败: {e}")
+        )
+
+    def _fetch_temperature_info(self) -> Dict:
+        """
+        实际获取温度信息的函数（在后台线程执行）
+
+        Returns:
+            传感器名称 -> 温度列表，出错时包含 'error' 键
+        """
+        temp_info = {}
+
+        if _HAS_SENSORS_TEMPERATURES:
+            temps = psutil.sensors_temperatures()
+
+            if temps:
+                for name, entries in temps.items():
+                    temp_list = []
+                    for entry in entries:
+                        temp_data = {
+                            'label': entry.label or name,
+                            'current': entry.current,
+                            'high': entry.high,
+                            'critical': entry.critical
+                        }
+                        temp_list.append(temp_data)
+                    temp_info[name] = temp_list
             else:
-                temp_info['error'] = "当前系统不支持温度监控"
-
-            self.temperature_updated.emit(temp_info)
-            return temp_info
-
-        except Exception as e:
-            error_msg = f"获取温度信息失败: {str(e)}"
-            self.error_occurred.emit(error_msg)
-            return {'error': error_msg}
-
-    def get_battery_info(self) -> Dict:
-        """获取电池信息"""
-        try:
-            battery_info = {}
-
-            if hasattr(psutil, 'sensors_battery'):
-                battery = psutil.sensors_battery()
-
-                if battery:
-                    battery_info = {
-                        'percent': battery.percent,
-                        'power_plugged': battery.power_plugged,
-                        'seconds_left': battery.secsleft if not battery.power_plugged else None,
-                    }
-
-                    # 计算剩余时间（小时:分钟格式）
-                    if battery_info['seconds_left'] and battery_info['seconds_left'] != -1:
-                        hours = battery_info['seconds_left'] // 3600
-                        minutes = (battery_info['seconds_left'] % 3600) // 60
-                        battery_info['time_left_formatted'] = f"{hours}小时{minutes}分钟"
-                    else:
-                        battery_info['time_left_formatted'] = "正在充电或无法估算"
-
-                    battery_info['status'] = "充电中" if battery.power_plugged else "使用电池"
+                temp_info['error'] = "未检测到温度传感器"
+        else:
+            temp_info['error'] = "当前系统不支持温度监控"
+
+        return temp_info
+
+    def _fetch_battery_info(self) -> Dict:
+        """
+        实际获取电池信息的函数（在后台线程执行）
+
+        Returns:
+            电池信息字典，出错时包含 'error' 键
+        """
+        battery_info = {}
+
+        if _HAS_SENSORS_BATTERY:
+            battery = psutil.sensors_battery()
+
+            if battery:
+                battery_info = {
+                    'percent': battery.percent,
+                    'power_plugged': battery.power_plugged,
+                    'seconds_left': battery.secsleft if not battery.power_plugged else None,
+                }
+
+                # 计算剩余时间（小时:分钟格式）
+                if battery_info['seconds_left'] and battery_info['seconds_left'] != -1:
+                    hours = battery_info['seconds_left'] // 3600
+                    minutes = (battery_info['seconds_left'] % 3600) // 60
+                    battery_info['time_left_formatted'] = f"{hours}小时{minutes}分钟"
                 else:
-                    battery_info['error'] = "未检测到电池"
+                    battery_info['time_left_formatted'] = "正在充电或无法估算"
+
+                battery_info['status'] = "充电中" if battery.power_plugged else "使用电池"
             else:
-                battery_info['error'] = "当前系统不支持电池监控"
+                battery_info['error'] = "未检测到电池"
+        else:
+            battery_info['error'] = "当前系统不支持电池监控"
 
-            self.battery_updated.emit(battery_info)
-            return battery_info
+        return battery_info
 
-        except Exception as e:
-            error_msg = f"获取电池信息失败: {str(e)}"
-            self.error_occurred.emit(error_msg)
-            return {'error': error_msg}
+    def _fetch_services_info(self) -> List[Dict]:
+        """
+        实际获取Windows服务信息的函数（在后台线程执行）
 
-    def get_services_info(self) -> List[Dict]:
-        """获取Windows服务信息"""
-        try:
-            services = []
-
-            if platform.system() == 'Windows':
-                try:
-                    import win32service
-                    import win32con
-
-                    # 打开服务管理器
-                    hscm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_ENUMERATE_SERVICE)
-
-                    # 获取所有服务
-                    service_list = win32service.EnumServicesStatus(
-                        hscm,
-                        win32service.SERVICE_WIN32,
-                        win32service.SERVICE_STATE_ALL
-                    )
-
-                    # 关闭服务管理器句柄
-                    win32service.CloseServiceHandle(hscm)
-
-                    for service in service_list[:100]:  # 限制显示前100个服务
-                        service_name = service[0]
-                        display_name = service[1]
-                        status_code = service[2][1]
-
-                        # 转换状态码
-                        status_map = {
-                            win32service.SERVICE_STOPPED: "已停止",
-                            win32service.SERVICE_START_PENDING: "启动中",
-                            win32service.SERVICE_STOP_PENDING: "停止中",
-                            win32service.SERVICE_RUNNING: "运行中",
-                            win32service.SERVICE_CONTINUE_PENDING: "继续中",
-                            win32service.SERVICE_PAUSE_PENDING: "暂停中",
-                            win32service.SERVICE_PAUSED: "已暂停",
-                        }
+        Returns:
+            服务信息列表，出错时为只包含 'error' 键的单元素列表
+        """
+        if not platform_info.IS_WINDOWS:
+            return [{'error': '仅支持Windows系统'}]
 
-                        services.append({
-                            'name': service_name,
-                            'display_name': display_name,
-                            'status': status_map.get(status_code, "未知"),
-                            'status_code': status_code
-                        })
-
-                except ImportError:
-                    services = [{'error': '需要安装 pywin32 库'}]
-                except Exception as e:
-                    services = [{'error': f'获取服务失败: {str(e)}'}]
-            else:
-                services = [{'error': '仅支持Windows系统'}]
-
-            self.services_updated.emit(services)
-            return services
+        try:
+            import win32service
+        except ImportError:
+            return [{'error': '需要安装 pywin32 库'}]
 
+        try:
+            # 打开服务管理器
+            hscm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_ENUMERATE_SERVICE)
+
+            # 获取所有服务
+            service_list = win32service.EnumServicesStatus(
+                hscm,
+                win32service.SERVICE_WIN32,
+                win32service.SERVICE_STATE_ALL
+            )
+
+            # 关闭服务管理器句柄
+            win32service.CloseServiceHandle(hscm)
         except Exception as e:
-            error_msg = f"获取服务信息失败: {str(e)}"
-            self.error_occurred.emit(error_msg)
-            return [{'error': error_msg}]
+            return [{'error': f'获取服务失败: {str(e)}'}]
+
+        # 转换状态码
+        status_map = {
+            win32service.SERVICE_STOPPED: "已停止",
+            win32service.SERVICE_START_PENDING: "启动中",
+            win32service.SERVICE_STOP_PENDING: "停止中",
+            win32service.SERVICE_RUNNING: "运行中",
+            win32service.SERVICE_CONTINUE_PENDING: "继续中",
+            win32service.SERVICE_PAUSE_PENDING: "暂停中",
+            win32service.SERVICE_PAUSED: "已暂停",
+        }
+
+        services = []
+        for service_name, display_name, status in service_list[:100]:  # 限制显示前100个服务
+            status_code = status[1]
+            services.append({
+                'name': service_name,
+                'display_name': display_name,
+                'status': status_map.get(status_code, "未知"),
+                'status_code': status_code
+            })
+
+        return services
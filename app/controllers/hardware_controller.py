@@ -6,16 +6,30 @@
 """
 
 import psutil
-import platform
 import subprocess
 import re
 import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from PySide6.QtCore import QObject, Signal
 
+from app.utils import platform_info
 from app.utils.async_worker import AsyncWorkerManager
 
 
+# 地址族 -> 名称，直接查表而不对每个地址调用枚举的 __str__
+# （Python 3.11起 IntEnum 的 str() 只返回数值，界面无法据此区分地址类型）
+_FAMILY_NAMES = {
+    socket.AF_INET: 'AF_INET',
+    socket.AF_INET6: 'AF_INET6',
+}
+if hasattr(socket, 'AF_PACKET'):
+    _FAMILY_NAMES[socket.AF_PACKET] = 'AF_PACKET'
+_FAMILY_NAMES.setdefault(psutil.AF_LINK, 'AF_LINK')
+
+
 class HardwareController(QObject):
     """硬件信息控制器"""
 
@@ -26,16 +40,236 @@ class HardwareController(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.worker_manager = AsyncWorkerManager(self)
+        self._hardware_cache = None
+        self._last_update = 0
+        self._cache_duration = 30.0  # 硬件信息很少变化，最小采集间隔（秒）
+
+        # CPU型号、核心数、主板等运行期间不变的信息只采集一次
+        self._static_info = None
+
+        # 上次采集的CPU时间，用于非阻塞计算CPU使用率（创建时先采样一次作为基准）
+        try:
+            self._last_cpu_times = psutil.cpu_times()
+            self._last_per_cpu_times = psutil.cpu_times(percpu=True)
+        except Exception:
+            self._last_cpu_times = None
+            self._last_per_cpu_times = []
+
+        # 网络接口地址（getifaddrs）单独缓存，生命周期长于整体硬件信息
+        self._netif_cache = None
+        self._netif_updated = 0
+        self._netif_ttl = 60.0  # 秒
+
+    def get_hardware_info(self, force_refresh: bool = False):
+        """
+        获取硬件信息（异步执行）
+
+        Args:
+            force_refresh: 是否强制刷新，忽略缓存
+        """
+        # 距上次采集不足最小间隔时直接重发缓存
+        if not force_refresh and self._is_cache_fresh():
+            self.hardware_info_updated.emit(self._hardware_cache)
+            return
+
+        # 强制刷新时网络接口地址也重新读取，不沿用其TTL缓存
+        if force_refresh:
+            self.invalidate_netif_cache()
 
-    def get_hardware_info(self) -> Dict:
-        """获取硬件信息（异步执行）"""
         self.worker_manager.execute(
             name='get_hardware_info',
             target_func=self._fetch_hardware_info,
-            callback=self.hardware_info_updated.emit,
+            callback=self._on_hardware_info_fetched,
             error_callback=lambda e: self.error_occurred.emit(f"获取硬件信息失败: {e}")
         )
 
+    def invalidate_netif_cache(self):
+        """使网络接口地址缓存失效（强制刷新时调用），下次采集时重新读取"""
+        self._netif_cache = None
+
+    def _get_network_interfaces(self) -> Dict:
+        """
+        获取网络接口地址信息（按TTL缓存，网卡列表和地址很少变化）
+
+        Returns:
+            接口名称 -> 地址信息列表
+        """
+        now = time.monotonic()
+        if self._netif_cache is not None and (now - self._netif_updated) < self._netif_ttl:
+            return self._netif_cache
+
+        family_names = _FAMILY_NAMES
+        network_interfaces = {
+            interface_name: [
+                {
+                    'family': family_names.get(addr.family) or str(addr.family),
+                    'address': addr.address,
+                    'netmask': addr.netmask,
+                    'broadcast': addr.broadcast
+                }
+                for addr in addresses
+            ]
+            for interface_name, addresses in psutil.net_if_addrs().items()
+        }
+
+        self._netif_cache = network_interfaces
+        self._netif_updated = now
+        return network_interfaces
+
+    def _get_static_info(self) -> Dict:
+        """
+        获取运行期间不会变化的硬件信息（首次调用时采集，之后直接返回缓存）
+
+        Returns:
+            {'cpu': CPU静态信息, 'motherboard': 主板信息}
+        """
+        if self._static_info is None:
+            self._static_info = {
+                'cpu': self._get_static_cpu_info(),
+                'motherboard': self._get_motherboard_info(),
+            }
+        return self._static_info
+
+    def _get_static_cpu_info(self) -> Dict:
+        """获取CPU静态信息（核心数、型号、缓存、特性等）"""
+        cpu_info = {
+            'physical_cores': platform_info.CPU_COUNT_PHYSICAL,
+            'logical_cores': platform_info.CPU_COUNT_LOGICAL,
+            'processor': platform_info.PROCESSOR,
+            'architecture': platform_info.MACHINE or 'Unknown',
+            'hostname': platform_info.NODE,
+        }
+
+        # 获取CPU缓存信息（仅Linux）
+        try:
+            if platform_info.IS_LINUX:
+                cache_info = {}
+                # L1缓存
+                for cache_type in ['dcache', 'icache']:
+                    cache_path = f'/sys/devices/system/cpu/cpu0/cache/index0/{cache_type}'
+                    if os.path.exists(cache_path):
+                        try:
+                            with open(cache_path, 'r') as f:
+                                cache_info[cache_type] = f.read().strip()
+                        except:
+                            pass
+
+                # 尝试读取缓存大小
+                for level in [0, 1, 2, 3]:
+                    size_path = f'/sys/devices/system/cpu/cpu0/cache/index{level}/size'
+                    if os.path.exists(size_path):
+                        try:
+                            with open(size_path, 'r') as f:
+                                cache_info[f'L{level}_cache'] = f.read().strip()
+                        except:
+                            pass
+
+                if cache_info:
+                    cpu_info['cache_info'] = cache_info
+        except:
+            pass
+
+        # 获取CPU型号和特性
+        try:
+            if platform_info.IS_LINUX:
+                # 读取 /proc/cpuinfo
+                try:
+                    with open('/proc/cpuinfo', 'r') as f:
+                        cpuinfo_content = f.read()
+
+                    # 提取CPU型号
+                    for line in cpuinfo_content.split('\n'):
+                        if line.startswith('model name'):
+                            cpu_info['model_name'] = line.split(':', 1)[1].strip()
+                            break
+                        elif line.startswith('Hardware'):
+                            cpu_info['hardware'] = line.split(':', 1)[1].strip()
+
+                    # 提取CPU特性
+                    for line in cpuinfo_content.split('\n'):
+                        if line.startswith('flags') or line.startswith('Features'):
+                            flags = line.split(':', 1)[1].strip()
+                            cpu_info['flags'] = flags.split()
+                            break
+                except:
+                    pass
+            elif platform_info.IS_WINDOWS:
+                # 使用 WMI 获取更详细的CPU信息
+                try:
+                    import wmi
+                    c = wmi.WMI()
+                    for cpu in c.Win32_Processor():
+                        cpu_info['model_name'] = cpu.Name
+                        cpu_info['manufacturer'] = cpu.Manufacturer
+                        cpu_info['max_clock_speed'] = cpu.MaxClockSpeed
+                        cpu_info['current_clock_speed'] = cpu.CurrentClockSpeed
+                        cpu_info['number_of_cores'] = cpu.NumberOfCores
+                        cpu_info['number_of_logical_processors'] = cpu.NumberOfLogicalProcessors
+                        cpu_info['l2_cache_size'] = getattr(cpu, 'L2CacheSize', None)
+                        cpu_info['l3_cache_size'] = getattr(cpu, 'L3CacheSize', None)
+                        cpu_info['virtualization'] = getattr(cpu, 'VirtualizationFirmwareEnabled', False)
+                        break
+                except:
+                    pass
+        except:
+            pass
+
+        return cpu_info
+
+    @staticmethod
+    def _busy_percent(last, current) -> float:
+        """
+        根据两次CPU时间采样计算使用率（与psutil.cpu_percent的计算方式一致）
+
+        Args:
+            last: 上次采样的CPU时间
+            current: 本次采样的CPU时间
+
+        Returns:
+            使用率（百分比），无法计算时为0.0
+        """
+        if last is None or current is None:
+            return 0.0
+
+        def busy_and_total(times):
+            # Linux上guest时间已计入user/nice，需从总时间中扣除
+            total = sum(times) - getattr(times, 'guest', 0) - getattr(times, 'guest_nice', 0)
+            return total - times.idle - getattr(times, 'iowait', 0), total
+
+        last_busy, last_total = busy_and_total(last)
+        busy, total = busy_and_total(current)
+        if total <= last_total:
+            return 0.0
+        percent = (busy - last_busy) / (total - last_total) * 100
+        return round(min(max(percent, 0.0), 100.0), 1)
+
+    @staticmethod
+    def _disk_usage_or_error(mountpoint: str):
+        """
+        查询分区容量（在线程池中执行），出错时返回异常对象而不是抛出
+
+        Args:
+            mountpoint: 挂载点
+
+        Returns:
+            psutil.disk_usage 的结果，或查询时发生的异常
+        """
+        try:
+            return psutil.disk_usage(mountpoint)
+        except Exception as e:
+            return e
+
+    def _is_cache_fresh(self) -> bool:
+        """缓存是否仍在最小采集间隔内"""
+        return self._hardware_cache is not None and \
+            (time.monotonic() - self._last_update) < self._cache_duration
+
+    def _on_hardware_info_fetched(self, hardware_info: Dict):
+        """硬件信息获取完成回调"""
+        self._hardware_cache = hardware_info
+        self._last_update = time.monotonic()
+        self.hardware_info_updated.emit(hardware_info)
+
     def _fetch_hardware_info(self) -> Dict:
         """
         实际获取硬件信息的函数（在后台线程执行）
@@ -45,15 +279,10 @@ class HardwareController(QObject):
         """
         try:
             hardware_info = {}
+            static_info = self._get_static_info()
 
-            # CPU信息
-            cpu_info = {
-                'physical_cores': psutil.cpu_count(logical=False),
-                'logical_cores': psutil.cpu_count(logical=True),
-                'processor': platform.processor(),
-                'architecture': platform.machine() if hasattr(platform, 'machine') else 'Unknown',
-                'hostname': platform.node(),
-            }
+            # CPU信息：静态部分来自缓存，拷贝后再补充本次采集的动态数据
+            cpu_info = dict(static_info['cpu'])
 
             # CPU频率信息
             try:
@@ -64,20 +293,28 @@ class HardwareController(QObject):
                         'min': cpu_freq.min,
                         'max': cpu_freq.max
                     }
+                    # WMI提供的当前时钟频率在静态缓存中会过期，用本次采样值覆盖
+                    if 'current_clock_speed' in cpu_info:
+                        cpu_info['current_clock_speed'] = int(cpu_freq.current)
             except:
                 pass
 
-            # 每个核心的使用率（百分比）
-            try:
-                cpu_info['per_cpu_percent'] = psutil.cpu_percent(interval=0.1, percpu=True)
-            except:
-                cpu_info['per_cpu_percent'] = []
-
-            # 总体CPU使用率
+            # CPU时间采样，同时用于计算使用率和下方的时间信息
             try:
-                cpu_info['cpu_percent'] = psutil.cpu_percent(interval=0.1)
+                cpu_times = psutil.cpu_times()
+                cpu_times_percpu = psutil.cpu_times(percpu=True)
             except:
-                cpu_info['cpu_percent'] = 0
+                cpu_times = None
+                cpu_times_percpu = []
+
+            # 总体及每个核心的使用率（百分比）：与上次采集的CPU时间做差，不阻塞等待采样间隔
+            cpu_info['cpu_percent'] = self._busy_percent(self._last_cpu_times, cpu_times)
+            cpu_info['per_cpu_percent'] = [
+                self._busy_percent(last, current)
+                for last, current in zip(self._last_per_cpu_times, cpu_times_percpu)
+            ]
+            self._last_cpu_times = cpu_times
+            self._last_per_cpu_times = cpu_times_percpu
 
             # CPU统计信息（上下文切换、中断、系统调用等）
             try:
@@ -93,7 +330,6 @@ class HardwareController(QObject):
 
             # CPU时间信息（用户、系统、空闲等）
             try:
-                cpu_times = psutil.cpu_times()
                 cpu_info['times'] = {
                     'user': cpu_times.user,
                     'system': cpu_times.system,
@@ -116,7 +352,6 @@ class HardwareController(QObject):
 
             # 每个核心的时间信息
             try:
-                cpu_times_percpu = psutil.cpu_times(percpu=True)
                 cpu_info['per_cpu_times'] = []
                 for times in cpu_times_percpu:
                     core_time = {
@@ -136,81 +371,6 @@ class HardwareController(QObject):
             except:
                 pass
 
-            # 获取CPU缓存信息（仅Linux）
-            try:
-                if platform.system() == 'Linux':
-                    import os
-                    cache_info = {}
-                    # L1缓存
-                    for cache_type in ['dcache', 'icache']:
-                        cache_path = f'/sys/devices/system/cpu/cpu0/cache/index0/{cache_type}'
-                        if os.path.exists(cache_path):
-                            try:
-                                with open(cache_path, 'r') as f:
-                                    cache_info[cache_type] = f.read().strip()
-                            except:
-                                pass
-
-                    # 尝试读取缓存大小
-                    for level in [0, 1, 2, 3]:
-                        size_path = f'/sys/devices/system/cpu/cpu0/cache/index{level}/size'
-                        if os.path.exists(size_path):
-                            try:
-                                with open(size_path, 'r') as f:
-                                    cache_info[f'L{level}_cache'] = f.read().strip()
-                            except:
-                                pass
-
-                    if cache_info:
-                        cpu_info['cache_info'] = cache_info
-            except:
-                pass
-
-            # 获取CPU型号和特性
-            try:
-                if platform.system() == 'Linux':
-                    # 读取 /proc/cpuinfo
-                    try:
-                        with open('/proc/cpuinfo', 'r') as f:
-                            cpuinfo_content = f.read()
-
-                        # 提取CPU型号
-                        for line in cpuinfo_content.split('\n'):
-                            if line.startswith('model name'):
-                                cpu_info['model_name'] = line.split(':', 1)[1].strip()
-                                break
-                            elif line.startswith('Hardware'):
-                                cpu_info['hardware'] = line.split(':', 1)[1].strip()
-
-                        # 提取CPU特性
-                        for line in cpuinfo_content.split('\n'):
-                            if line.startswith('flags') or line.startswith('Features'):
-                                flags = line.split(':', 1)[1].strip()
-                                cpu_info['flags'] = flags.split()
-                                break
-                    except:
-                        pass
-                elif platform.system() == 'Windows':
-                    # 使用 WMI 获取更详细的CPU信息
-                    try:
-                        import wmi
-                        c = wmi.WMI()
-                        for cpu in c.Win32_Processor():
-                            cpu_info['model_name'] = cpu.Name
-                            cpu_info['manufacturer'] = cpu.Manufacturer
-                            cpu_info['max_clock_speed'] = cpu.MaxClockSpeed
-                            cpu_info['current_clock_speed'] = cpu.CurrentClockSpeed
-                            cpu_info['number_of_cores'] = cpu.NumberOfCores
-                            cpu_info['number_of_logical_processors'] = cpu.NumberOfLogicalProcessors
-                            cpu_info['l2_cache_size'] = getattr(cpu, 'L2CacheSize', None)
-                            cpu_info['l3_cache_size'] = getattr(cpu, 'L3CacheSize', None)
-                            cpu_info['virtualization'] = getattr(cpu, 'VirtualizationFirmwareEnabled', False)
-                            break
-                    except:
-                        pass
-            except:
-                pass
-
             # 获取CPU负载（1分钟、5分钟、15分钟）
             try:
                 if hasattr(os, 'getloadavg'):
@@ -242,11 +402,20 @@ class HardwareController(QObject):
 
             hardware_info['memory'] = memory_info
 
-            # 磁盘信息
+            # 磁盘信息：各分区的容量查询可能因网络挂载、休眠磁盘而阻塞，并行查询
             disks = []
-            for partition in psutil.disk_partitions():
+            partitions = psutil.disk_partitions()
+            if partitions:
+                with ThreadPoolExecutor(max_workers=min(8, len(partitions))) as executor:
+                    usages = list(executor.map(self._disk_usage_or_error,
+                                               [partition.mountpoint for partition in partitions]))
+            else:
+                usages = []
+
+            for partition, disk_usage in zip(partitions, usages):
                 try:
-                    disk_usage = psutil.disk_usage(partition.mountpoint)
+                    if isinstance(disk_usage, Exception):
+                        raise disk_usage
                     disk_info = {
                         'device': partition.device,
                         'mountpoint': partition.mountpoint,
@@ -268,26 +437,13 @@ class HardwareController(QObject):
             hardware_info['disks'] = disks
 
             # 网络接口信息
-            network_interfaces = {}
-            for interface_name, addresses in psutil.net_if_addrs().items():
-                interface_info = []
-                for addr in addresses:
-                    addr_info = {
-                        'family': str(addr.family),
-                        'address': addr.address,
-                        'netmask': addr.netmask,
-                        'broadcast': addr.broadcast
-                    }
-                    interface_info.append(addr_info)
-                network_interfaces[interface_name] = interface_info
-
-            hardware_info['network_interfaces'] = network_interfaces
+            hardware_info['network_interfaces'] = self._get_network_interfaces()
 
             # 显卡信息
             hardware_info['gpus'] = self._get_gpu_info()
 
-            # 主板信息
-            hardware_info['motherboard'] = self._get_motherboard_info()
+            # 主板信息（静态）
+            hardware_info['motherboard'] = static_info['motherboard']
 
             # 温度传感器信息
             hardware_info['temperatures'] = self._get_temperature_info()
@@ -575,7 +731,7 @@ class HardwareController(QObject):
                     pass
 
             # Windows 下使用 WMI 获取 GPU 信息
-            if not gpus and platform.system() == 'Windows':
+            if not gpus and platform_info.IS_WINDOWS:
                 try:
                     import wmi
                     c = wmi.WMI()
@@ -636,7 +792,7 @@ class HardwareController(QObject):
         motherboard_info = {}
 
         try:
-            if platform.system() == 'Linux':
+            if platform_info.IS_LINUX:
                 # Linux 下读取 DMI 信息
                 try:
                     # 获取主板制造商
@@ -663,7 +819,7 @@ class HardwareController(QObject):
                 except Exception as e:
                     motherboard_info['error'] = f"读取主板信息失败: {str(e)}"
 
-            elif platform.system() == 'Windows':
+            elif platform_info.IS_WINDOWS:
                 # Windows 下使用 WMI 获取主板信息
                 try:
                     import wmi
@@ -687,7 +843,7 @@ class HardwareController(QObject):
                 except Exception as e:
                     motherboard_info['error'] = f"获取主板信息失败: {str(e)}"
             else:
-                motherboard_info['message'] = f"{platform.system()} 系统暂不支持主板信息获取"
+                motherboard_info['message'] = f"{platform_info.SYSTEM} 系统暂不支持主板信息获取"
 
         except Exception as e:
             motherboard_info['error'] = str(e)
@@ -787,22 +943,24 @@ class HardwareController(QObject):
         audio_info = {'input_devices': [], 'output_devices': []}
 
         try:
-            if platform.system() == 'Windows':
+            if platform_info.IS_WINDOWS:
                 try:
                     import pyaudio
                     p = pyaudio.PyAudio()
 
                     for i in range(p.get_device_count()):
                         info = p.get_device_info_by_index(i)
+                        input_channels = info.get('maxInputChannels', 0)
+                        output_channels = info.get('maxOutputChannels', 0)
                         device = {
                             'name': info.get('name', 'Unknown'),
-                            'channels': info.get('maxInputChannels', 0) if info.get('maxInputChannels', 0) > 0 else info.get('maxOutputChannels', 0),
+                            'channels': input_channels if input_channels > 0 else output_channels,
                             'sample_rate': int(info.get('defaultSampleRate', 0)),
                         }
 
-                        if info.get('maxInputChannels', 0) > 0:
+                        if input_channels > 0:
                             audio_info['input_devices'].append(device)
-                        if info.get('maxOutputChannels', 0) > 0:
+                        if output_channels > 0:
                             audio_info['output_devices'].append(device)
 
                     p.terminate()
@@ -811,7 +969,7 @@ class HardwareController(QObject):
                 except Exception as e:
                     audio_info['error'] = f"获取音频设备失败: {str(e)}"
             else:
-                audio_info['message'] = f"{platform.system()} 系统音频设备获取待实现"
+                audio_info['message'] = f"{platform_info.SYSTEM} 系统音频设备获取待实现"
 
         except Exception as e:
             audio_info['error'] = str(e)
@@ -823,7 +981,7 @@ class HardwareController(QObject):
         bluetooth_devices = []
 
         try:
-            if platform.system() == 'Windows':
+            if platform_info.IS_WINDOWS:
                 try:
                     import wmi
                     c = wmi.WMI()
@@ -840,9 +998,6 @@ class HardwareController(QObject):
 
                     # 获取配对的蓝牙设备
                     try:
-                        import win32com.client
-                        shell = win32com.client.Dispatch("WScript.Shell")
-                        # 尝试获取蓝牙设备信息
                         for device in c.Win32_PnPEntity():
                             if 'Bluetooth' in device.Name or 'bluetooth' in device.Name:
                                 bluetooth_devices.append({
@@ -869,7 +1024,7 @@ class HardwareController(QObject):
                     else:
                         bluetooth_devices.append({'message': '未检测到蓝牙适配器'})
                 except:
-                    bluetooth_devices.append({'message': f'{platform.system()} 系统蓝牙设备检测待实现'})
+                    bluetooth_devices.append({'message': f'{platform_info.SYSTEM} 系统蓝牙设备检测待实现'})
 
         except Exception as e:
             bluetooth_devices.append({'error': str(e)})
@@ -881,7 +1036,7 @@ class HardwareController(QObject):
         usb_devices = []
 
         try:
-            if platform.system() == 'Windows':
+            if platform_info.IS_WINDOWS:
                 try:
                     import wmi
                     c = wmi.WMI()
@@ -899,16 +1054,17 @@ class HardwareController(QObject):
                     hid_devices = []
                     for device in c.Win32_PnPEntity():
                         device_name = device.Name or ''
+                        name_lower = device_name.lower()  # 每个设备只转换一次
                         # 过滤出鼠标、键盘等HID设备
-                        if any(keyword in device_name.lower() for keyword in ['mouse', 'keyboard', 'hid', 'usb', 'input']):
+                        if any(keyword in name_lower for keyword in ('mouse', 'keyboard', 'hid', 'usb', 'input')):
                             device_type = '其他'
-                            if 'mouse' in device_name.lower():
+                            if 'mouse' in name_lower:
                                 device_type = '鼠标'
-                            elif 'keyboard' in device_name.lower() or 'kbd' in device_name.lower():
+                            elif 'keyboard' in name_lower or 'kbd' in name_lower:
                                 device_type = '键盘'
-                            elif 'hid' in device_name.lower():
+                            elif 'hid' in name_lower:
                                 device_type = '人机接口设备'
-                            elif 'usb' in device_name.lower():
+                            elif 'usb' in name_lower:
                                 device_type = 'USB设备'
 
                             hid_devices.append({
@@ -938,7 +1094,6 @@ class HardwareController(QObject):
                 try:
                     usb_info = []
                     # 读取/sys/bus/usb/devices/
-                    import os
                     usb_path = '/sys/bus/usb/devices/'
                     if os.path.exists(usb_path):
                         for device_dir in os.listdir(usb_path):
@@ -973,7 +1128,7 @@ class HardwareController(QObject):
         input_devices = {'keyboards': [], 'mice': []}
 
         try:
-            if platform.system() == 'Windows':
+            if platform_info.IS_WINDOWS:
                 try:
                     import wmi
                     c = wmi.WMI()
@@ -1005,14 +1160,27 @@ class HardwareController(QObject):
                 except Exception as e:
                     input_devices['error'] = f"获取输入设备失败: {str(e)}"
             else:
-                input_devices['message'] = f"{platform.system()} 系统输入设备检测待实现"
+                input_devices['message'] = f"{platform_info.SYSTEM} 系统输入设备检测待实现"
 
         except Exception as e:
             input_devices['error'] = str(e)
 
         return input_devices
 
-    def get_hardware_info_sync(self) -> Dict:
-        """同步获取硬件信息（用于对话框，仍会阻塞）"""
-        return self._fetch_hardware_info()
+    def get_hardware_info_sync(self, force_refresh: bool = False) -> Dict:
+        """
+        同步获取硬件信息（用于对话框；缓存有效时直接返回，否则会阻塞）
+
+        Args:
+            force_refresh: 是否强制重新采集，忽略缓存（用户手动刷新时使用）
+
+        Returns:
+            硬件信息字典
+        """
+        if force_refresh:
+            self.invalidate_netif_cache()
+        if force_refresh or not self._is_cache_fresh():
+            self._hardware_cache = self._fetch_hardware_info()
+            self._last_update = time.monotonic()
+        return self._hardware_cache
 
@@ -6,11 +6,15 @@
 """
 
 import psutil
+import socket
 import time
+from itertools import islice
 from typing import List
 from PySide6.QtCore import QObject, Signal
 
 from app.models import NetworkConnection
+from app.utils import net_snapshot
+from app.utils.async_worker import AsyncWorkerManager
 
 
 class NetworkController(QObject):
@@ -25,62 +29,68 @@ class NetworkController(QObject):
         self._connections_cache = []
         self._last_update = 0
         self._cache_duration = 3.0  # 缓存持续时间（秒）
+        self.worker_manager = AsyncWorkerManager(self)
     
-    def get_connections(self, force_refresh: bool = False) -> List[NetworkConnection]:
-        """获取网络连接列表"""
-        current_time = time.time()
+    def get_connections(self, force_refresh: bool = False):
+        """
+        获取网络连接列表（异步执行）
+
+        Args:
+            force_refresh: 是否强制刷新，忽略缓存
+        """
+        current_time = time.monotonic()
         
-        # 如果缓存有效且不强制刷新，返回缓存
+        # 如果缓存有效且不强制刷新，直接发送缓存
         if not force_refresh and (current_time - self._last_update) < self._cache_duration:
-            return self._connections_cache
+            self.connections_updated.emit(self._connections_cache)
+            return
         
-        try:
-            connections = []
-            max_connections = 500  # 限制最大连接数
-            
-            # 获取所有网络连接
-            try:
-                all_conns = psutil.net_connections(kind='inet')
-            except psutil.AccessDenied:
-                self.error_occurred.emit("权限不足，无法获取网络连接信息")
-                return self._connections_cache if self._connections_cache else []
-            
-            for idx, conn in enumerate(all_conns):
-                if idx >= max_connections:
-                    break
-                    
-                try:
-                    # 格式化地址
-                    local_addr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A"
-                    remote_addr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A"
-                    
-                    # 协议类型
-                    protocol = "TCP" if conn.type == 1 else "UDP"
-                    
-                    # 连接状态
-                    status = conn.status if conn.status else "N/A"
-                    
-                    connection_info = NetworkConnection(
-                        protocol=protocol,
-                        local_addr=local_addr,
-                        remote_addr=remote_addr,
-                        status=status,
-                        pid=conn.pid
-                    )
-                    
-                    connections.append(connection_info)
-                    
-                except Exception:
-                    continue
-            
-            # 更新缓存
-            self._connections_cache = connections
-            self._last_update = current_time
-            
-            self.connections_updated.emit(connections)
-            return connections
-            
-        except Exception as e:
-            self.error_occurred.emit(f"获取网络连接失败: {str(e)}")
-            return self._connections_cache if self._connections_cache else []
+        # 异步获取网络连接，避免阻塞界面线程
+        self.worker_manager.execute(
+            name='get_connections',
+            target_func=self._fetch_connections,
+            callback=self._on_connections_fetched,
+            error_callback=lambda e: self.error_occurred.emit(f"获取网络连接失败: {e}"),
+            max_age=0 if force_refresh else net_snapshot.SNAPSHOT_TTL
+        )
+    
+    def _fetch_connections(self, max_age: float = net_snapshot.SNAPSHOT_TTL) -> List[NetworkConnection]:
+        """
+        实际获取网络连接的函数（在后台线程执行）
 
+        Args:
+            max_age: 可复用的连接快照最长存在时间（秒），为0时强制重新枚举
+
+        Returns:
+            网络连接列表
+        """
+        max_connections = 500  # 限制最大连接数
+        
+        # 获取所有网络连接（与进程流量统计共用短时快照）
+        try:
+            all_conns = net_snapshot.inet_connections(max_age)
+        except psutil.AccessDenied:
+            raise PermissionError("权限不足，无法获取网络连接信息")
+        
+        # 一次列表推导构造所有连接信息，常量提前放入局部变量
+        sock_stream = socket.SOCK_STREAM
+        connections = [
+            NetworkConnection(
+                protocol="TCP" if conn.type == sock_stream else "UDP",
+                local_addr=f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
+                remote_addr=f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
+                status=conn.status or "N/A",
+                pid=conn.pid
+            )
+            for conn in islice(all_conns, max_connections)
+        ]
+        
+        return connections
+    
+    def _on_connections_fetched(self, connections: List[NetworkConnection]):
+        """网络连接获取完成回调"""
+        # 更新缓存
+        self._connections_cache = connections
+        self._last_update = time.monotonic()
+        
+        self.connections_updated.emit(connections)
@@ -5,31 +5,114 @@
 负责进程信息的获取和管理
 """
 
+import functools
+import heapq
 import psutil
 import time
 from datetime import datetime
-from typing import List, Optional, Dict
+from operator import itemgetter
+from typing import List, Optional, Dict, Sequence
 from PySide6.QtCore import QObject, Signal
 
 from app.models import ProcessInfo
+from app.utils import procfs, platform_info
 from app.utils.async_worker import AsyncWorkerManager
 
+# psutil路径第一遍为每个匹配的进程读取的字段（按内存选取时同时读取常驻内存）
+_SAMPLE_ATTRS = ['cpu_percent']
+_SAMPLE_ATTRS_BY_MEMORY = ['cpu_percent', 'memory_info']
+
+# psutil路径第二遍只为最终显示的进程读取的字段
+_DETAIL_ATTRS = ['memory_info', 'status', 'create_time']
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(ts: int) -> str:
+    """
+    格式化进程创建时间（按整数秒缓存，同一进程在多次刷新之间只格式化一次）
+
+    Args:
+        ts: 时间戳（秒）
+
+    Returns:
+        格式化后的时间字符串
+    """
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+
 
 class ProcessController(QObject):
     """进程管理控制器"""
 
     # 信号定义
-    processes_updated = Signal(list)
+    processes_updated = Signal(object)  # Sequence[ProcessInfo]
     process_killed = Signal(int, str)  # pid, message
     error_occurred = Signal(str)
 
+    # 选取前 max_processes 个进程时可依据的指标
+    SORT_KEYS = ('cpu_percent', 'memory_percent')
+
+    # /proc 遍历结果的复用时间（秒），期间修改过滤条件或排序列不重新遍历
+    SCAN_TTL = 0.5
+
     def __init__(self):
         super().__init__()
-        self._processes_cache = []
+        self._processes_cache = ()
         self._last_update = 0
         self._cache_duration = 2.0  # 缓存持续时间（秒）
+        self._last_sig = 0  # 上次发送的进程列表签名（只在界面线程读写）
+        self.max_processes = 200  # 限制获取的进程数量，避免性能问题
+        self._consumers = 0  # 当前正在显示进程列表的视图数量
+        self._name_filter = ''  # 进程名过滤（小写），在后台线程中读取
+        self._sort_by = 'cpu_percent'  # 选取前 max_processes 个进程的指标，在后台线程中读取
         self.worker_manager = AsyncWorkerManager(self)
 
+        # psutil路径复用的Process对象（pid -> psutil.Process），定期清理
+        self._proc_cache = {}
+        self._proc_cache_pruned = 0.0
+        self._proc_cache_prune_interval = 30.0  # 清理间隔（秒）
+
+        # Linux /proc 快速路径的采样状态
+        self._cpu_times = {}  # pid -> 上次采样的CPU时间（秒）
+        self._last_sample_time = 0.0
+        self._scan_cache = (0.0, None)  # (遍历时间, 遍历结果)
+        self._names_lower = (None, None)  # (遍历结果中的名称列表, 对应的小写名称列表)
+        self._total_memory = None
+
+    def add_consumer(self):
+        """登记一个正在显示进程列表的视图"""
+        self._consumers += 1
+
+    def remove_consumer(self):
+        """注销一个不再显示进程列表的视图"""
+        self._consumers = max(0, self._consumers - 1)
+
+    def set_name_filter(self, text: str):
+        """
+        设置进程名过滤条件，下次获取时只保留名称包含该文本的进程
+
+        Args:
+            text: 过滤文本（不区分大小写）
+        """
+        name_filter = text.strip().lower()
+        if name_filter != self._name_filter:
+            self._name_filter = name_filter
+            self._last_update = 0
+            self._last_sig = 0
+
+    def set_sort_key(self, sort_by: str):
+        """
+        设置选取前 max_processes 个进程所依据的指标，与界面当前的排序列保持一致
+
+        Args:
+            sort_by: SORT_KEYS 之一，其他值按CPU使用率处理
+        """
+        if sort_by not in self.SORT_KEYS:
+            sort_by = 'cpu_percent'
+        if sort_by != self._sort_by:
+            self._sort_by = sort_by
+            self._last_update = 0
+            self._last_sig = 0
+
     def get_processes(self, force_refresh: bool = False):
         """
         获取进程列表（异步执行）
@@ -37,8 +120,12 @@ class ProcessController(QObject):
         Args:
             force_refresh: 是否强制刷新，忽略缓存
         """
+        # 没有视图在显示进程列表时跳过非强制刷新
+        if not force_refresh and self._consumers == 0:
+            return
+
         # 检查缓存
-        current_time = time.time()
+        current_time = time.monotonic()
         if not force_refresh and (current_time - self._last_update) < self._cache_duration:
             self.processes_updated.emit(self._processes_cache)
             return
@@ -51,59 +138,314 @@ class ProcessController(QObject):
             error_callback=lambda e: self.error_occurred.emit(f"获取进程列表失败: {e}")
         )
 
-    def _fetch_processes(self) -> List[ProcessInfo]:
+    def _fetch_processes(self) -> tuple:
         """
         实际获取进程列表的函数（在后台线程执行）
 
         Returns:
-            进程信息列表
+            (进程信息元组, 列表签名)
         """
-        processes = []
+        processes = None
+
+        # Linux 下直接解析 /proc，失败时回退到psutil
+        if procfs.IS_LINUX:
+            try:
+                processes = self._fetch_processes_linux()
+            except OSError:
+                processes = None
+
+        if processes is None:
+            processes = self._fetch_processes_psutil()
+
+        # 更新缓存（不可变元组，可直接共享给界面）
+        processes = tuple(processes)
+        self._processes_cache = processes
+        self._last_update = time.monotonic()
+
+        # 签名在后台计算，由界面线程比较和记录，只有真正送达的结果才计入
+        return processes, self._processes_signature(processes)
+
+    def _fetch_processes_linux(self) -> List[ProcessInfo]:
+        """
+        通过直接读取 /proc/<pid>/stat 获取进程列表（仅Linux）
+
+        Returns:
+            按 sort_by 指标降序的前 max_processes 个进程
+        """
+        if self._total_memory is None:
+            self._total_memory = procfs.read_mem_total()
+
+        pids, names, statuses, start_times, rss_list, cpu_list = self._scan_processes_linux()
+
+        # 详情和结束进程也会向Process缓存中添加对象，这里同样定期清理
+        self._prune_proc_cache(pids)
+
+        # 按名称过滤后，只为排序指标最高的进程构造ProcessInfo（内存使用率与常驻内存同序）
+        name_filter = self._name_filter
+        if name_filter:
+            names_lower = self._lower_names(names)
+            candidates = [i for i, name in enumerate(names_lower) if name_filter in name]
+        else:
+            candidates = range(len(pids))
+        sort_list = rss_list if self._sort_by == 'memory_percent' else cpu_list
+        top = heapq.nlargest(self.max_processes, candidates, key=sort_list.__getitem__)
+
+        total_memory = self._total_memory
+        boot_time = platform_info.BOOT_TIME
+        process_info, fmt_ts = ProcessInfo, _fmt_ts
+        return [
+            process_info(
+                pid=pids[i],
+                name=names[i],
+                cpu_percent=cpu_list[i],
+                memory_percent=rss_list[i] / total_memory * 100,
+                memory_mb=rss_list[i] / (1024 * 1024),
+                status=statuses[i],
+                create_time=fmt_ts(int(boot_time + start_times[i]))
+            )
+            for i in top
+        ]
+
+    def _scan_processes_linux(self) -> tuple:
+        """
+        遍历 /proc 采集所有进程的字段并计算CPU使用率
+
+        SCAN_TTL 内再次调用（如连续修改过滤条件或排序列）直接复用上次的结果，不重新遍历
+
+        Returns:
+            (pids, names, statuses, start_times, rss_list, cpu_list) 按列存放的并行列表
+        """
+        now = time.monotonic()
+        scan_time, scan = self._scan_cache
+        if scan is not None and now - scan_time < self.SCAN_TTL:
+            return scan
+
+        # 按列存放所有进程的字段（并行列表），选取时只比较排序列
+        pids, names, statuses, start_times, rss_list, cpu_list = [], [], [], [], [], []
+        elapsed = now - self._last_sample_time
+        cpu_scale = 100 / elapsed if elapsed > 0 else 0.0
+        cpu_times = {}
+
+        # 循环内用到的方法提前绑定到局部变量，每个进程省去多次属性查找
+        get_prev = self._cpu_times.get
+        add_pid, add_name, add_status = pids.append, names.append, statuses.append
+        add_start, add_rss, add_cpu = start_times.append, rss_list.append, cpu_list.append
+
+        for pid, name, status, cpu_time, start_time, rss in procfs.iter_pid_stats():
+            prev = get_prev(pid)
+            cpu_times[pid] = cpu_time
+
+            # CPU使用率按两次采样之间的CPU时间增量计算，首次出现的进程记为0
+            cpu_percent = (cpu_time - prev) * cpu_scale if prev is not None else 0.0
+            add_pid(pid)
+            add_name(name)
+            add_status(status)
+            add_start(start_time)
+            add_rss(rss)
+            add_cpu(cpu_percent if cpu_percent > 0.0 else 0.0)
+
+        self._cpu_times = cpu_times
+        self._last_sample_time = now
+
+        scan = (pids, names, statuses, start_times, rss_list, cpu_list)
+        # 时间和结果作为一个元组整体替换，并发的后台任务不会读到不一致的状态
+        self._scan_cache = (now, scan)
+        return scan
+
+    def _lower_names(self, names: List[str]) -> List[str]:
+        """
+        获取遍历结果中名称的小写形式，同一次遍历结果只转换一次
+
+        SCAN_TTL 内连续修改过滤条件时复用同一份遍历结果，不必每次都逐个调用 lower()
+
+        Args:
+            names: _scan_processes_linux 返回的名称列表
+
+        Returns:
+            与 names 一一对应的小写名称列表
+        """
+        cached_names, names_lower = self._names_lower
+        if cached_names is not names:
+            names_lower = list(map(str.lower, names))
+            # 与遍历结果一起整体替换，并发的后台任务不会读到不一致的状态
+            self._names_lower = (names, names_lower)
+        return names_lower
+
+    def invalidate_snapshot(self):
+        """丢弃缓存的 /proc 遍历结果，下次获取时重新遍历（结束进程后调用）"""
+        self._scan_cache = (0.0, None)
 
-        # 限制获取的进程数量，避免性能问题
-        max_processes = 200
-        process_count = 0
+    def _fetch_processes_psutil(self) -> List[ProcessInfo]:
+        """
+        通过psutil获取进程列表
+
+        分两遍读取：第一遍对所有进程只读取名称并按名称过滤，对匹配的进程采样CPU使用率
+        （按内存选取时同时读取常驻内存），第二遍只为排序指标最高的 max_processes 个进程
+        读取内存、状态等其余字段
 
-        # 一次性获取所有需要的属性，减少系统调用
-        attrs = ['pid', 'name', 'cpu_percent', 'memory_percent', 'memory_info', 'status', 'create_time']
+        Returns:
+            按 sort_by 指标降序的前 max_processes 个进程
+        """
+        if self._total_memory is None:
+            self._total_memory = psutil.virtual_memory().total
 
-        for proc in psutil.process_iter(attrs):
-            if process_count >= max_processes:
-                break
+        candidates = []
+        add_candidate = candidates.append
+        proc_cache = self._proc_cache
+        name_filter = self._name_filter
+        by_memory = self._sort_by == 'memory_percent'
+        sample_attrs = _SAMPLE_ATTRS_BY_MEMORY if by_memory else _SAMPLE_ATTRS
+        pids = psutil.pids()
+        self._prune_proc_cache(pids)
 
+        # 第一遍：直接按PID构造Process对象并复用缓存，保留cpu_percent的上次采样和psutil内部缓存。
+        # 依赖 psutil>=6.0：不再在每次迭代时为每个PID读取创建时间做复用检查，
+        # 结束进程等修改操作由psutil自行校验PID复用，这里只在 _prune_proc_cache 中定期检查
+        for pid in pids:
             try:
-                # 创建进程信息对象
-                process_info = ProcessInfo(
-                    pid=proc.info['pid'],
-                    name=proc.info['name'],
-                    cpu_percent=proc.info['cpu_percent'] or 0,
-                    memory_percent=proc.info['memory_percent'] or 0,
-                    memory_mb=proc.info['memory_info'].rss / (1024 * 1024) if proc.info['memory_info'] else 0,
-                    status=proc.info['status'],
-                    create_time=datetime.fromtimestamp(proc.info['create_time']).strftime('%Y-%m-%d %H:%M:%S') if proc.info['create_time'] else 'N/A'
-                )
-                processes.append(process_info)
-                process_count += 1
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                proc = proc_cache.get(pid)
+                if proc is None:
+                    proc = proc_cache[pid] = psutil.Process(pid)
+
+                with proc.oneshot():
+                    try:
+                        name = proc.name()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        # ZombieProcess是NoSuchProcess的子类，需在外层的NoSuchProcess之前处理，
+                        # 僵尸进程与无权访问的进程一样继续列出
+                        name = ''
+
+                    # 名称不匹配的进程只读取名称即排除，不再采样CPU时间；
+                    # 过滤条件变化后，这些进程的CPU使用率按距上次采样的整段时间计算
+                    if name_filter and name_filter not in name.lower():
+                        continue
+
+                    # 无权读取的字段（以及僵尸进程无法读取的字段）记为None，进程本身仍然列出
+                    info = proc.as_dict(sample_attrs, ad_value=None)
+            except psutil.NoSuchProcess:
+                # 进程已退出，移出缓存
+                proc_cache.pop(pid, None)
                 continue
 
-        # 按CPU使用率排序
-        processes.sort(key=lambda p: p.cpu_percent, reverse=True)
+            memory_info = info.get('memory_info')
+            add_candidate((info['cpu_percent'] or 0, memory_info.rss if memory_info else 0, pid, name, proc))
 
-        # 更新缓存
-        self._processes_cache = processes
-        self._last_update = time.time()
+        # 第二遍：只为最终显示的进程读取其余字段
+        processes = []
+        total_memory = self._total_memory
+        # 排序键使用C实现的itemgetter，选取时比较不再进入Python层的lambda
+        sort_key = itemgetter(1 if by_memory else 0)
+        for cpu_percent, _, pid, name, proc in heapq.nlargest(
+                self.max_processes, candidates, key=sort_key):
+            try:
+                # as_dict 内部使用 oneshot；无权读取的字段和僵尸进程无法读取的字段记为None
+                info = proc.as_dict(_DETAIL_ATTRS, ad_value=None)
+            except psutil.NoSuchProcess:
+                proc_cache.pop(pid, None)
+                continue
+
+            memory_info = info['memory_info']
+            rss = memory_info.rss if memory_info else 0
+            create_time = info['create_time']
+            processes.append(ProcessInfo(
+                pid=pid,
+                name=name,
+                cpu_percent=cpu_percent,
+                memory_percent=rss / total_memory * 100,
+                memory_mb=rss / (1024 * 1024),
+                status=info['status'] or 'N/A',
+                create_time=_fmt_ts(int(create_time)) if create_time else 'N/A'
+            ))
 
         return processes
 
-    def _on_processes_fetched(self, processes: List[ProcessInfo]):
-        """进程列表获取完成回调"""
+    def _get_proc(self, pid: int) -> psutil.Process:
+        """
+        获取PID对应的Process对象，优先复用缓存（进程列表、详情和结束进程共用）
+
+        Args:
+            pid: 进程ID
+
+        Returns:
+            Process对象
+
+        Raises:
+            psutil.NoSuchProcess: 进程不存在
+        """
+        proc = self._proc_cache.get(pid)
+        if proc is None:
+            proc = self._proc_cache[pid] = psutil.Process(pid)
+        return proc
+
+    def _prune_proc_cache(self, pids: List[int]):
+        """
+        定期清理Process缓存：移除已退出或PID已被复用（创建时间不同）的进程
+
+        Args:
+            pids: 当前进程PID列表
+        """
+        now = time.monotonic()
+        if now - self._proc_cache_pruned < self._proc_cache_prune_interval:
+            return
+        self._proc_cache_pruned = now
+
+        live = set(pids)
+        for pid, proc in list(self._proc_cache.items()):
+            # is_running() 会比较创建时间，可识别PID复用
+            if pid not in live or not proc.is_running():
+                self._proc_cache.pop(pid, None)
+
+    @staticmethod
+    def _processes_signature(processes: Sequence[ProcessInfo]) -> int:
+        """
+        计算进程列表签名（CPU按0.5%、内存按1MB分桶）
+
+        Args:
+            processes: 进程信息列表
+
+        Returns:
+            签名哈希值
+        """
+        return hash(tuple((p.pid, int(p.cpu_percent * 2), int(p.memory_mb)) for p in processes))
+
+    def _on_processes_fetched(self, result: tuple):
+        """进程列表获取完成回调：列表没有明显变化时不再通知界面重建表格"""
+        processes, sig = result
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
         self.processes_updated.emit(processes)
 
-    def kill_process(self, pid: int, force: bool = False) -> bool:
-        """结束进程"""
+    def kill_process(self, pid: int, force: bool = False):
+        """
+        结束进程（异步执行，进程真正退出后发送process_killed信号）
+
+        Args:
+            pid: 进程ID
+            force: 是否强制结束
+        """
+        self.worker_manager.execute(
+            f'kill_process_{pid}',
+            self._kill_process,
+            self._on_process_killed,
+            self.error_occurred.emit,
+            pid, force
+        )
+
+    def _kill_process(self, pid: int, force: bool) -> tuple:
+        """
+        实际结束进程的函数（在后台线程执行）
+
+        Args:
+            pid: 进程ID
+            force: 是否强制结束
+
+        Returns:
+            (pid, 结果消息)
+        """
         try:
-            proc = psutil.Process(pid)
+            # 复用进程列表缓存的Process对象（psutil在发送信号前会校验PID是否已被复用）
+            proc = self._get_proc(pid)
             process_name = proc.name()
 
             if force:
@@ -113,41 +455,75 @@ class ProcessController(QObject):
                 proc.terminate()
                 message = f"结束进程 {process_name} (PID: {pid}) 成功"
 
-            self.process_killed.emit(pid, message)
-
-            # 清除缓存，强制刷新
-            self._last_update = 0
+            # 等待进程退出，随后的刷新即可看到结果；
+            # 无论是否按时退出都移出缓存，避免PID被复用后仍拿旧的Process对象操作新进程
+            try:
+                proc.wait(timeout=1)
+            except psutil.TimeoutExpired:
+                pass
+            finally:
+                self._proc_cache.pop(pid, None)
 
-            return True
+            # 下次刷新重新遍历 /proc，不再显示已结束的进程
+            self.invalidate_snapshot()
+            return pid, message
 
         except psutil.NoSuchProcess:
-            self.error_occurred.emit(f"进程 {pid} 不存在")
-            return False
+            self._proc_cache.pop(pid, None)
+            raise ProcessLookupError(f"进程 {pid} 不存在")
         except psutil.AccessDenied:
-            self.error_occurred.emit(f"权限不足，无法结束进程 {pid}")
-            return False
+            raise PermissionError(f"权限不足，无法结束进程 {pid}")
         except Exception as e:
-            self.error_occurred.emit(f"结束进程 {pid} 失败: {str(e)}")
-            return False
+            raise RuntimeError(f"结束进程 {pid} 失败: {str(e)}")
+
+    def _on_process_killed(self, result: tuple):
+        """进程结束完成回调"""
+        pid, message = result
 
-    def get_process_details(self, pid: int) -> Optional[Dict]:
-        """获取进程详细信息"""
+        # 清除缓存和签名，强制刷新
+        self._last_update = 0
+        self._last_sig = 0
+
+        self.process_killed.emit(pid, message)
+
+    def get_process_details(self, pid: int, include_connections: bool = False) -> Optional[Dict]:
+        """
+        获取进程详细信息
+
+        Args:
+            pid: 进程ID
+            include_connections: 是否统计进程的网络连接数（需要枚举该进程的所有套接字，默认不统计）
+
+        Returns:
+            进程详情字典，进程不存在或获取失败时返回None
+        """
         try:
-            proc = psutil.Process(pid)
-
-            details = {
-                'pid': proc.pid,
-                'name': proc.name(),
-                'status': proc.status(),
-                'create_time': datetime.fromtimestamp(proc.create_time()).strftime('%Y-%m-%d %H:%M:%S'),
-                'cpu_percent': proc.cpu_percent(),
-                'memory_percent': proc.memory_percent(),
-                'memory_info': proc.memory_info(),
-                'num_threads': proc.num_threads(),
-                'exe': proc.exe() if proc.exe() else "未知",
-                'cwd': proc.cwd() if proc.cwd() else "未知",
-                'cmdline': proc.cmdline(),
-            }
+            proc = self._get_proc(pid)
+
+            # oneshot 合并同一进程的多次 /proc 读取，exe/cwd 各只读取一次
+            with proc.oneshot():
+                exe = proc.exe()
+                cwd = proc.cwd()
+                details = {
+                    'pid': proc.pid,
+                    'name': proc.name(),
+                    'status': proc.status(),
+                    'create_time': _fmt_ts(int(proc.create_time())),
+                    'cpu_percent': proc.cpu_percent(),
+                    'memory_percent': proc.memory_percent(),
+                    'memory_info': proc.memory_info(),
+                    'num_threads': proc.num_threads(),
+                    'exe': exe or "未知",
+                    'cwd': cwd or "未知",
+                    'cmdline': proc.cmdline(),
+                }
+
+            # 网络连接数（psutil>=6.0 的 net_connections，调用方明确需要时才统计）
+            if include_connections:
+                try:
+                    details['connections'] = len(proc.net_connections(kind='inet'))
+                except psutil.AccessDenied:
+                    details['connections'] = None
 
             # 获取父进程信息
             try:
@@ -170,6 +546,7 @@ class ProcessController(QObject):
             return details
 
         except psutil.NoSuchProcess:
+            self._proc_cache.pop(pid, None)
             return None
         except Exception as e:
             self.error_occurred.emit(f"获取进程 {pid} 详情失败: {str(e)}")
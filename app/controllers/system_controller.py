@@ -5,19 +5,24 @@
 负责系统信息的获取和更新
 """
 
+import os
 import psutil
-import platform
+import random
+import shutil
+import time
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal, QTimer
 
 from app.models import SystemInfo
+from app.utils import procfs, platform_info
+from app.utils.async_worker import AsyncWorkerManager
 
 
 class SystemMonitorController(QObject):
     """系统监控控制器"""
     
     # 信号定义
-    system_info_updated = Signal(SystemInfo)
+    system_info_updated = Signal(object)  # SystemInfo
     error_occurred = Signal(str)
     
     def __init__(self):
@@ -27,6 +32,43 @@ class SystemMonitorController(QObject):
         self._timer = QTimer()
         self._timer.timeout.connect(self._update_system_info)
         self._cpu_initialized = False  # CPU监控是否已初始化
+        self.worker_manager = AsyncWorkerManager(self)
+
+        # CPU使用率最小采样间隔，调用过快时返回上次的值
+        self._cpu_min_interval = 1.0  # 秒
+        self._cpu_value = 0.0
+        self._cpu_sampled = 0.0
+
+        # 磁盘使用情况变化缓慢，按TTL缓存
+        self._disk_ttl = 15.0  # 秒
+        self._disk_usage = None
+        self._disk_sampled = 0.0
+        self._disk_path = 'C:\\' if platform_info.IS_WINDOWS else '/'
+
+        # CPU核心数运行期间不会变化，只获取一次
+        self._cpu_count = platform_info.CPU_COUNT_LOGICAL
+
+        # 启动时间在本次会话内不会变化，只计算一次
+        self._boot_ts = platform_info.BOOT_TIME
+        self._boot_str = datetime.fromtimestamp(self._boot_ts).strftime('%Y-%m-%d %H:%M:%S')
+
+        # SystemInfo中运行期间不变的字段，只构建一次，每次采集时直接展开
+        self._static_fields = {
+            'cpu_count': self._cpu_count,
+            'boot_time': self._boot_str,
+            'system': platform_info.SYSTEM,
+            'node': platform_info.NODE,
+            'release': platform_info.RELEASE,
+            'version': platform_info.VERSION,
+            'machine': platform_info.MACHINE,
+            'processor': platform_info.PROCESSOR,
+            'python_version': platform_info.PYTHON_VERSION,
+            'python_build': platform_info.PYTHON_BUILD,
+            'python_compiler': platform_info.PYTHON_COMPILER,
+            'architecture': platform_info.ARCHITECTURE,
+            'hostname': platform_info.NODE,
+            'username': platform_info.USERNAME,
+        }
     
     def start_monitoring(self):
         """开始监控"""
@@ -35,7 +77,7 @@ class SystemMonitorController(QObject):
             # 异步初始化CPU监控
             if not self._cpu_initialized:
                 QTimer.singleShot(0, self._init_cpu_monitoring)
-            self._timer.start(int(self.update_interval * 1000))
+            self._timer.start(self._jittered_interval())
     
     def stop_monitoring(self):
         """停止监控"""
@@ -47,7 +89,7 @@ class SystemMonitorController(QObject):
         """设置更新间隔"""
         self.update_interval = interval
         if self.is_running:
-            self._timer.setInterval(int(interval * 1000))
+            self._timer.setInterval(self._jittered_interval())
     
     def _init_cpu_monitoring(self):
         """初始化CPU监控（在后台异步执行）"""
@@ -57,89 +99,128 @@ class SystemMonitorController(QObject):
         except Exception as e:
             print(f"初始化CPU监控失败: {e}")
     
-    def _update_system_info(self):
-        """更新系统信息"""
-        try:
-            # CPU信息（不阻塞，使用缓存值）
-            cpu_percent = psutil.cpu_percent(interval=0)
-            cpu_count = psutil.cpu_count()
-            
-            # 内存信息
-            memory = psutil.virtual_memory()
-            
-            # 磁盘信息
+    def _pid_count(self) -> int:
+        """获取进程数量（Linux下直接统计 /proc 目录项）"""
+        if procfs.IS_LINUX:
             try:
-                disk = psutil.disk_usage('/')
-            except:
-                disk = psutil.disk_usage('C:\\')
-            
-            # 启动时间和运行时间
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            boot_time_str = boot_time.strftime('%Y-%m-%d %H:%M:%S')
-            
-            uptime = datetime.now() - boot_time
-            days = uptime.days
-            hours, remainder = divmod(uptime.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
-            uptime_str = f"{days}天 {hours}小时 {minutes}分钟"
-            
-            # 进程数量
-            process_count = len(psutil.pids())
-            
-            # 网络IO统计
-            net_io = psutil.net_io_counters()
-
-            # 操作系统信息
-            system = platform.system()
-            node = platform.node()
-            release = platform.release()
-            version = platform.version()
-            machine = platform.machine()
-            processor = platform.processor()
-
-            # Python环境信息
-            python_version = platform.python_version()
-            python_build = f"{platform.python_build()[0]} [{platform.python_build()[1]}]"
-            python_compiler = platform.python_compiler()
-
-            # 详细系统信息
-            architecture = f"{platform.architecture()[0]} ({platform.architecture()[1]})"
-            hostname = platform.node()
-            username = platform.username() if hasattr(platform, 'username') else 'Unknown'
-
-            # 创建系统信息对象
-            system_info = SystemInfo(
-                cpu_percent=cpu_percent,
-                cpu_count=cpu_count,
-                memory_percent=memory.percent,
-                memory_used=memory.used,
-                memory_total=memory.total,
-                memory_available=memory.available,
-                disk_percent=disk.percent,
-                disk_used=disk.used,
-                disk_total=disk.total,
-                disk_free=disk.free,
-                boot_time=boot_time_str,
-                uptime=uptime_str,
-                process_count=process_count,
-                bytes_sent=net_io.bytes_sent,
-                bytes_recv=net_io.bytes_recv,
-                system=system,
-                node=node,
-                release=release,
-                version=version,
-                machine=machine,
-                processor=processor,
-                python_version=python_version,
-                python_build=python_build,
-                python_compiler=python_compiler,
-                architecture=architecture,
-                hostname=hostname,
-                username=username
-            )
-            
-            self.system_info_updated.emit(system_info)
-            
-        except Exception as e:
-            self.error_occurred.emit(f"获取系统信息失败: {str(e)}")
+                return procfs.count_pids()
+            except OSError:
+                pass
+        return len(psutil.pids())
+
+    def _read_memory(self) -> tuple:
+        """
+        获取内存使用情况（Linux下一次读取 /proc/meminfo）
+
+        Returns:
+            (总量, 已用, 可用, 使用率%)
+        """
+        if procfs.IS_LINUX:
+            try:
+                return procfs.read_memory()
+            except (OSError, KeyError, ValueError):
+                pass
+        memory = psutil.virtual_memory()
+        return memory.total, memory.used, memory.available, memory.percent
+
+    def _read_disk_usage(self) -> tuple:
+        """
+        获取系统盘使用情况（直接调用statvfs，与psutil.disk_usage()口径一致）
+
+        Returns:
+            (总量, 已用, 可用, 使用率%)
+        """
+        if not hasattr(os, 'statvfs'):
+            usage = shutil.disk_usage(self._disk_path)
+            percent = usage.used / usage.total * 100 if usage.total else 0.0
+            return usage.total, usage.used, usage.free, round(percent, 1)
+
+        st = os.statvfs(self._disk_path)
+        total = st.f_blocks * st.f_frsize
+        free = st.f_bavail * st.f_frsize  # 普通用户可用空间
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        # 与df一致：使用率按普通用户可用的容量计算（不含保留块）
+        usable = used + free
+        percent = used / usable * 100 if usable else 0.0
+        return total, used, free, round(percent, 1)
+
+    def _jittered_interval(self) -> int:
+        """
+        计算带±10%随机抖动的定时器间隔，避免与其他周期性任务同步采样
+
+        Returns:
+            定时器间隔（毫秒）
+        """
+        return int(self.update_interval * 1000 * random.uniform(0.9, 1.1))
+
+    def _update_system_info(self):
+        """更新系统信息（在后台线程采集，避免阻塞界面）"""
+        self._timer.setInterval(self._jittered_interval())
+
+        # 上一次采集的结果界面还没处理完时跳过本次，避免信号排队堆积
+        if self.worker_manager.is_busy('system_info'):
+            return
+
+        self.worker_manager.execute(
+            name='system_info',
+            target_func=self._collect_system_info,
+            callback=self.system_info_updated.emit,
+            error_callback=lambda e: self.error_occurred.emit(f"获取系统信息失败: {e}")
+        )
+
+    def _collect_system_info(self) -> SystemInfo:
+        """
+        采集系统信息（在后台线程执行）
+
+        Returns:
+            系统信息对象
+        """
+        now = time.monotonic()
+
+        # CPU信息（不阻塞；两次采样间隔过短时沿用上次的值）
+        if now - self._cpu_sampled >= self._cpu_min_interval:
+            self._cpu_value = psutil.cpu_percent(interval=0)
+            self._cpu_sampled = now
+        cpu_percent = self._cpu_value
+        
+        # 内存信息
+        memory_total, memory_used, memory_available, memory_percent = self._read_memory()
+        
+        # 磁盘信息（TTL缓存）
+        if self._disk_usage is None or now - self._disk_sampled >= self._disk_ttl:
+            self._disk_usage = self._read_disk_usage()
+            self._disk_sampled = now
+        disk_total, disk_used, disk_free, disk_percent = self._disk_usage
+        
+        # 运行时间直接由时间戳差值换算，不构造datetime对象
+        days, remainder = divmod(int(time.time() - self._boot_ts), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes = remainder // 60
+        uptime_str = f"{days}天 {hours}小时 {minutes}分钟"
+        
+        # 进程数量
+        process_count = self._pid_count()
+        
+        # 网络IO统计
+        net_io = psutil.net_io_counters()
+
+        # 创建系统信息对象（运行期间不变的字段来自预先构建的字典）
+        system_info = SystemInfo(
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            memory_used=memory_used,
+            memory_total=memory_total,
+            memory_available=memory_available,
+            disk_percent=disk_percent,
+            disk_used=disk_used,
+            disk_total=disk_total,
+            disk_free=disk_free,
+            uptime=uptime_str,
+            process_count=process_count,
+            bytes_sent=net_io.bytes_sent,
+            bytes_recv=net_io.bytes_recv,
+            **self._static_fields
+        )
+        
+        return system_info
 
@@ -7,12 +7,17 @@
 
 import psutil
 import time
+from collections import Counter
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from PySide6.QtCore import QObject, Signal, QTimer
 
+from app.models.system_models import DATACLASS_OPTIONS
+from app.utils import net_snapshot
+from app.utils.async_worker import AsyncWorkerManager
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class TrafficInfo:
     """流量信息数据类"""
     bytes_sent: int
@@ -21,7 +26,7 @@ class TrafficInfo:
     packets_recv: int
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ProcessTrafficInfo:
     """进程流量信息数据类"""
     pid: int
@@ -44,16 +49,15 @@ class TrafficMonitorController(QObject):
         self.is_monitoring = False
         self._timer = QTimer()
         self._timer.timeout.connect(self._update_traffic)
+        self.worker_manager = AsyncWorkerManager(self)
         
-        # 记录上一次的数值，用于计算速率
+        # 记录上一次的数值，用于计算速率（基准值在开始监控时获取）
         self._last_bytes_sent = 0
         self._last_bytes_recv = 0
-        self._last_update_time = time.time()
-        
-        # 初始化基准值
-        net_io = psutil.net_io_counters()
-        self._last_bytes_sent = net_io.bytes_sent
-        self._last_bytes_recv = net_io.bytes_recv
+        self._last_update_time = time.monotonic()
+
+        # 进程流量采集复用的Process对象（pid -> psutil.Process），只保留仍有连接的进程
+        self._proc_cache: Dict[int, psutil.Process] = {}
     
     def start_monitoring(self, interval: int = 1000):
         """
@@ -64,8 +68,19 @@ class TrafficMonitorController(QObject):
         """
         if not self.is_monitoring:
             self.is_monitoring = True
+            self._reset_baseline()
             self._timer.start(interval)
     
+    def _reset_baseline(self):
+        """以当前累计流量作为计算速率的基准值"""
+        try:
+            net_io = psutil.net_io_counters()
+            self._last_bytes_sent = net_io.bytes_sent
+            self._last_bytes_recv = net_io.bytes_recv
+        except Exception:
+            pass
+        self._last_update_time = time.monotonic()
+
     def stop_monitoring(self):
         """停止监控流量"""
         if self.is_monitoring:
@@ -77,7 +92,7 @@ class TrafficMonitorController(QObject):
         try:
             # 获取总流量
             net_io = psutil.net_io_counters()
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # 计算时间差
             time_delta = current_time - self._last_update_time
@@ -110,68 +125,67 @@ class TrafficMonitorController(QObject):
         except Exception as e:
             self.error_occurred.emit(f"更新流量信息失败: {str(e)}")
     
-    def get_process_traffic(self) -> List[ProcessTrafficInfo]:
+    def get_process_traffic(self):
         """
-        获取每个进程的流量信息
+        获取每个进程的流量信息（异步执行）
         注意：需要管理员权限才能获取进程的网络连接信息
         """
+        self.worker_manager.execute(
+            name='get_process_traffic',
+            target_func=self._fetch_process_traffic,
+            callback=self.process_traffic_updated.emit,
+            error_callback=lambda e: self.error_occurred.emit(f"获取进程流量失败: {e}")
+        )
+    
+    def _fetch_process_traffic(self) -> List[ProcessTrafficInfo]:
+        """
+        实际获取进程流量的函数（在后台线程执行）
+
+        Returns:
+            进程流量信息列表
+        """
+        # 获取所有网络连接（与网络连接列表共用短时快照）
         try:
-            process_traffic = {}
-            
-            # 获取所有网络连接
+            connections = net_snapshot.inet_connections()
+        except psutil.AccessDenied:
+            raise PermissionError("需要管理员权限才能获取进程流量信息")
+
+        # 统计每个进程的连接数
+        connection_counts = Counter(conn.pid for conn in connections if conn.pid)
+
+        # 复用上次采集的Process对象（保留psutil缓存的名称等），as_dict 在 oneshot 中一次读取名称和IO信息
+        # 注意：Windows上可能无法获取准确的网络IO
+        old_cache = self._proc_cache
+        proc_cache = {}
+        result = []
+        for pid, count in connection_counts.items():
             try:
-                connections = psutil.net_connections(kind='inet')
-            except psutil.AccessDenied:
-                self.error_occurred.emit("需要管理员权限才能获取进程流量信息")
-                return []
-            
-            # 统计每个进程的连接数
-            for conn in connections:
-                if conn.pid:
-                    if conn.pid not in process_traffic:
-                        try:
-                            proc = psutil.Process(conn.pid)
-                            process_traffic[conn.pid] = {
-                                'name': proc.name(),
-                                'connections': 0,
-                                'sent': 0,
-                                'recv': 0
-                            }
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            continue
-                    
-                    process_traffic[conn.pid]['connections'] += 1
-            
-            # 尝试获取每个进程的IO信息
-            # 注意：Windows上可能无法获取准确的网络IO
-            for pid, data in process_traffic.items():
-                try:
+                proc = old_cache.get(pid)
+                if proc is None:
                     proc = psutil.Process(pid)
-                    io_counters = proc.io_counters()
-                    # 注意：这是所有IO，不仅仅是网络IO
-                    data['sent'] = io_counters.write_bytes
-                    data['recv'] = io_counters.read_bytes
-                except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                    pass
-            
-            # 转换为列表
-            result = []
-            for pid, data in process_traffic.items():
-                result.append(ProcessTrafficInfo(
-                    pid=pid,
-                    name=data['name'],
-                    bytes_sent=data['sent'],
-                    bytes_recv=data['recv'],
-                    connections_count=data['connections']
-                ))
-            
-            # 按连接数排序
-            result.sort(key=lambda x: x.connections_count, reverse=True)
-            
-            self.process_traffic_updated.emit(result)
-            return result
-            
-        except Exception as e:
-            self.error_occurred.emit(f"获取进程流量失败: {str(e)}")
-            return []
+                info = proc.as_dict(attrs=['name', 'io_counters'], ad_value=None)
+            except psutil.NoSuchProcess:
+                continue
+            proc_cache[pid] = proc
+
+            name = info['name']
+            if name is None:
+                # 无权限读取进程名，与之前一样跳过
+                continue
 
+            # 注意：这是所有IO，不仅仅是网络IO
+            io_counters = info['io_counters']
+            result.append(ProcessTrafficInfo(
+                pid=pid,
+                name=name,
+                bytes_sent=io_counters.write_bytes if io_counters else 0,
+                bytes_recv=io_counters.read_bytes if io_counters else 0,
+                connections_count=count
+            ))
+
+        self._proc_cache = proc_cache
+
+        # 按连接数排序
+        result.sort(key=lambda x: x.connections_count, reverse=True)
+        
+        return result
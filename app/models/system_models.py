@@ -5,11 +5,15 @@
 定义系统监控相关的数据结构
 """
 
+import sys
 from dataclasses import dataclass
 from typing import List, Optional
 
+# Python 3.10+ 的数据类使用 __slots__：实例不带 __dict__，占用内存更少、属性访问更快
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class SystemInfo:
     """系统信息数据模型"""
     cpu_percent: float
@@ -45,7 +49,7 @@ class SystemInfo:
     username: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ProcessInfo:
     """进程信息数据模型"""
     pid: int
@@ -61,7 +65,7 @@ class ProcessInfo:
     parent_pid: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class NetworkConnection:
     """网络连接信息数据模型"""
     protocol: str
@@ -4,12 +4,17 @@
 Utils包 - 工具模块层
 """
 
-from .async_worker import AsyncWorker, AsyncWorkerManager
+from .async_worker import AsyncWorker, AsyncTask, AsyncWorkerManager, shared_thread_pool
 from .format_utils import format_bytes, format_frequency
+from .refresh_batcher import RefreshBatcher, RefreshThrottle
 
 __all__ = [
     'AsyncWorker',
+    'AsyncTask',
     'AsyncWorkerManager',
+    'shared_thread_pool',
     'format_bytes',
-    'format_frequency'
+    'format_frequency',
+    'RefreshBatcher',
+    'RefreshThrottle'
 ]
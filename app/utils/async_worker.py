@@ -2,10 +2,34 @@
 # -*- coding: utf-8 -*-
 """
 异步工作线程工具
-提供QThread包装器，用于在后台线程执行耗时操作
+提供QThread包装器和共享线程池任务，用于在后台线程执行耗时操作
 """
 
-from PySide6.QtCore import QThread, Signal, QObject
+from PySide6.QtCore import QThread, Signal, QObject, QRunnable, QThreadPool
+
+# 共享线程池的最大并发数：限制同时进行的psutil遍历，避免争用 /proc 等系统资源
+MAX_POOL_THREADS = 2
+
+# 空闲线程的保留时间（毫秒）：空闲线程在线程池内部的条件变量上休眠，不会轮询；
+# 保留时间长于最慢的周期刷新（服务列表30秒），避免每次刷新都重新创建线程
+POOL_EXPIRY_TIMEOUT = 60000
+
+_shared_pool = None
+
+
+def shared_thread_pool() -> QThreadPool:
+    """
+    获取所有控制器共享的后台线程池
+
+    Returns:
+        共享线程池
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = QThreadPool()
+        _shared_pool.setMaxThreadCount(MAX_POOL_THREADS)
+        _shared_pool.setExpiryTimeout(POOL_EXPIRY_TIMEOUT)
+    return _shared_pool
 
 
 class AsyncWorker(QThread):
@@ -43,12 +67,64 @@ class AsyncWorker(QThread):
         return self._result
 
 
+class _TaskSignals(QObject):
+    """线程池任务的信号载体（QRunnable本身不能发送信号）"""
+
+    finished = Signal(object)  # 完成信号，携带结果
+    error = Signal(str)  # 错误信号
+    done = Signal()  # 任务结束信号（无论成功、失败或已取消）
+
+
+class AsyncTask(QRunnable):
+    """在共享线程池中执行的异步任务"""
+
+    def __init__(self, target_func, *args, **kwargs):
+        """
+        初始化异步任务
+
+        Args:
+            target_func: 要执行的目标函数
+            *args: 位置参数
+            **kwargs: 关键字参数
+        """
+        super().__init__()
+        # 生命周期由AsyncWorkerManager管理，避免运行结束后被线程池提前析构
+        self.setAutoDelete(False)
+        self.target_func = target_func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+        self.cancelled = False  # 取消后不再发送结果
+
+    def run(self):
+        """执行目标函数"""
+        try:
+            result = self.target_func(*self.args, **self.kwargs)
+            if not self.cancelled:
+                self.signals.finished.emit(result)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.error.emit(str(e))
+        finally:
+            self.signals.done.emit()
+
+
 class AsyncWorkerManager(QObject):
-    """异步工作线程管理器"""
+    """
+    异步任务管理器（所有实例共享同一个有界线程池）
+
+    同名任务不会并发执行：提交时同名任务尚在排队则直接替换，已在执行则记为待执行，
+    等它结束（结果回调处理完）后再以最新一次提交的参数执行，
+    因此目标函数可以修改所属控制器的状态而不必考虑与同名任务竞争
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._workers = {}
+        self._workers = {}  # 任务名称 -> 当前任务（包括已取消但仍在执行的）
+        self._tasks = {}  # 任务ID -> 尚未结束的任务（包括已取消的）
+        self._pending = {}  # 任务名称 -> 等待同名任务结束后再执行的提交参数
+        self._next_id = 0
+        self._pool = shared_thread_pool()
 
     def execute(self, name, target_func, callback=None, error_callback=None, *args, **kwargs):
         """
@@ -61,39 +137,110 @@ class AsyncWorkerManager(QObject):
             error_callback: 错误回调函数
             *args: 位置参数
             **kwargs: 关键字参数
-        """
-        # 如果已有同名任务在运行，先停止
-        if name in self._workers and self._workers[name].isRunning():
-            self._workers[name].terminate()
-            self._workers[name].wait()
 
-        # 创建新的工作线程
-        worker = AsyncWorker(target_func, *args, **kwargs)
+        Returns:
+            已提交的任务，同名任务正在执行、本次提交被推迟时返回None
+        """
+        current = self._workers.get(name)
+        if current is not None:
+            if self._pool.tryTake(current):
+                # 同名任务尚未开始执行，直接从队列移除，由本次提交替换
+                self._discard(current)
+                del self._workers[name]
+            else:
+                # 同名任务正在执行：不并发执行，结束后再执行最新一次提交
+                self._pending[name] = (target_func, callback, error_callback, args, kwargs)
+                return None
+
+        return self._start(name, target_func, callback, error_callback, args, kwargs)
+
+    def _start(self, name, target_func, callback, error_callback, args, kwargs):
+        """创建任务并提交到共享线程池"""
+        task = AsyncTask(target_func, *args, **kwargs)
+        task_id = self._next_id
+        self._next_id += 1
 
         # 连接信号
         if callback:
-            worker.finished.connect(callback)
+            task.signals.finished.connect(callback)
         if error_callback:
-            worker.error.connect(error_callback)
+            task.signals.error.connect(error_callback)
+        task.signals.done.connect(lambda: self._release(name, task_id))
+
+        # 保存引用，直到任务结束
+        self._workers[name] = task
+        self._tasks[task_id] = task
+
+        # 提交到共享线程池
+        self._pool.start(task)
 
-        # 保存引用
-        self._workers[name] = worker
+        return task
 
-        # 启动线程
-        worker.start()
+    def _release(self, name, task_id):
+        """任务结束后释放引用，并执行推迟的同名提交"""
+        task = self._tasks.pop(task_id, None)
+        if task is not None and self._workers.get(name) is task:
+            del self._workers[name]
+
+        pending = self._pending.pop(name, None)
+        if pending is not None and name not in self._workers:
+            self._start(name, *pending)
 
-        return worker
+    def _discard(self, task):
+        """丢弃已从队列移除的任务（它不会再发送done信号）"""
+        task.cancelled = True
+        for task_id, queued in list(self._tasks.items()):
+            if queued is task:
+                del self._tasks[task_id]
+
+    def is_busy(self, name) -> bool:
+        """
+        判断同名任务是否仍在进行中
+
+        任务的结果回调在界面线程处理完之前都视为进行中，
+        可据此跳过新的提交，避免界面处理不过来时信号在队列中堆积
+
+        Args:
+            name: 任务名称
+
+        Returns:
+            是否有未结束的同名任务
+        """
+        return name in self._workers
 
     def stop(self, name):
-        """停止指定任务"""
-        if name in self._workers:
-            worker = self._workers[name]
-            if worker.isRunning():
-                worker.terminate()
-                worker.wait()
+        """停止指定任务（线程池任务无法强制中断，取消后其结果将被忽略）"""
+        self._pending.pop(name, None)
+        task = self._workers.get(name)
+        if task is None:
+            return
+
+        if self._pool.tryTake(task):
+            # 任务尚未开始执行，直接从队列移除
+            self._discard(task)
             del self._workers[name]
+        else:
+            # 正在执行的任务保留登记直到结束，期间新的同名提交仍会被推迟
+            task.cancelled = True
 
     def stop_all(self):
         """停止所有任务"""
         for name in list(self._workers.keys()):
             self.stop(name)
+        self._pending.clear()
+
+    @staticmethod
+    def wait_for_done(msecs: int = 2000) -> bool:
+        """
+        等待共享线程池中正在执行的任务结束（用于退出前，尚未开始的任务会被丢弃）
+
+        Args:
+            msecs: 最长等待时间（毫秒）
+
+        Returns:
+            是否所有任务都已结束
+        """
+        pool = shared_thread_pool()
+        # 丢弃尚未开始的任务，只等待正在执行的任务
+        pool.clear()
+        return pool.waitForDone(msecs)
@@ -5,6 +5,13 @@
 提供数据格式化等辅助功能
 """
 
+import math
+
+
+# 字节单位及对应的换算基数（1024的幂）
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_BYTE_SCALES = tuple(1 << (10 * i) for i in range(len(_BYTE_UNITS)))
+
 
 def format_bytes(bytes_value: int) -> str:
     """
@@ -16,11 +23,15 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         格式化后的字符串，如 "1.5 GB"
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.1f} B"
+    if not math.isfinite(bytes_value):
+        # inf/nan 没有二进制位数，按最大单位输出（与逐级相除时的结果一致）
+        return f"{bytes_value:.1f} PB"
+
+    # 按二进制位数直接确定单位（每10位进一级），只做一次除法
+    unit_idx = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / _BYTE_SCALES[unit_idx]:.1f} {_BYTE_UNITS[unit_idx]}"
 
 
 def format_frequency(freq_mhz: float) -> str:
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+网络连接快照
+psutil.net_connections 需要枚举系统中的所有套接字，开销较大；
+网络连接列表和进程流量统计共用一份短时缓存的快照
+"""
+
+import threading
+import time
+from typing import List, Optional
+
+import psutil
+
+# 快照有效期（秒）
+SNAPSHOT_TTL = 1.0
+
+_lock = threading.Lock()
+_snapshot: Optional[List] = None
+_snapshot_time = 0.0
+
+
+def inet_connections(max_age: float = SNAPSHOT_TTL) -> List:
+    """
+    获取所有IPv4/IPv6连接，快照未过期时直接复用
+
+    多个后台线程同时请求时，只有一个线程执行枚举，其余线程等待并共用结果
+
+    Args:
+        max_age: 可接受的快照最长存在时间（秒），为0时强制重新获取
+
+    Returns:
+        psutil.net_connections(kind='inet') 的结果（共享列表，调用方不得修改）
+
+    Raises:
+        psutil.AccessDenied: 权限不足
+    """
+    global _snapshot, _snapshot_time
+    with _lock:
+        now = time.monotonic()
+        if _snapshot is None or now - _snapshot_time >= max_age:
+            _snapshot = psutil.net_connections(kind='inet')
+            _snapshot_time = now
+        return _snapshot
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+平台信息常量
+操作系统和Python环境信息在进程运行期间不会变化，导入时获取一次
+"""
+
+import platform
+
+import psutil
+
+# 操作系统信息
+SYSTEM = platform.system()
+NODE = platform.node()
+RELEASE = platform.release()
+VERSION = platform.version()
+MACHINE = platform.machine()
+PROCESSOR = platform.processor()
+
+IS_WINDOWS = SYSTEM == 'Windows'
+IS_LINUX = SYSTEM == 'Linux'
+IS_MACOS = SYSTEM == 'Darwin'
+
+# Python环境信息
+PYTHON_VERSION = platform.python_version()
+PYTHON_BUILD = f"{platform.python_build()[0]} [{platform.python_build()[1]}]"
+PYTHON_COMPILER = platform.python_compiler()
+
+# 体系结构（如 "64bit (ELF)"）及位数
+_ARCH_BITS, _ARCH_LINKAGE = platform.architecture()
+ARCHITECTURE = f"{_ARCH_BITS} ({_ARCH_LINKAGE})"
+ARCHITECTURE_BITS = _ARCH_BITS
+
+USERNAME = platform.username() if hasattr(platform, 'username') else 'Unknown'
+
+# CPU核心数（psutil无法确定时为None）
+CPU_COUNT_PHYSICAL = psutil.cpu_count(logical=False)
+CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True)
+
+# 系统启动时间戳（秒），本次开机期间不会变化
+BOOT_TIME = psutil.boot_time()
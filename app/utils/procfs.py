@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Linux procfs读取工具
+直接解析 /proc 文件，跳过psutil的逐属性封装，用于高频刷新路径
+"""
+
+import os
+import sys
+from typing import Dict, Iterator, Optional, Tuple
+
+# 是否可以使用 /proc 快速路径
+IS_LINUX = sys.platform.startswith('linux')
+
+# 时钟频率和内存页大小（用于换算 /proc/<pid>/stat 中的字段）
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if IS_LINUX else 100
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if IS_LINUX else 4096
+
+# 进程状态码到psutil状态字符串的映射
+STATUS_MAP = {
+    'R': 'running',
+    'S': 'sleeping',
+    'D': 'disk-sleep',
+    'T': 'stopped',
+    't': 'tracing-stop',
+    'Z': 'zombie',
+    'X': 'dead',
+    'x': 'dead',
+    'K': 'wake-kill',
+    'W': 'waking',
+    'P': 'parked',
+    'I': 'idle',
+}
+
+
+def read_pid_stat(pid: int) -> Optional[Tuple[str, str, float, float, int]]:
+    """
+    读取并解析 /proc/<pid>/stat
+
+    Args:
+        pid: 进程ID
+
+    Returns:
+        (进程名, 状态, CPU时间(秒), 启动时间(开机后秒数), 常驻内存(字节))，
+        进程已退出时返回None
+    """
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            raw = f.read()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+
+    # 进程名可能包含空格和括号，以最后一个右括号为界
+    lpar = raw.find(b'(')
+    rpar = raw.rfind(b')')
+    name = raw[lpar + 1:rpar].decode('utf-8', 'replace')
+    fields = raw[rpar + 2:].split()
+
+    status = fields[0].decode('ascii', 'replace')
+    cpu_time = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    start_time = int(fields[19]) / CLOCK_TICKS
+    rss = int(fields[21]) * PAGE_SIZE
+
+    return name, STATUS_MAP.get(status, status), cpu_time, start_time, rss
+
+
+def iter_pid_stats() -> Iterator[Tuple[int, str, str, float, float, int]]:
+    """
+    遍历所有进程的 /proc/<pid>/stat
+
+    Yields:
+        (pid, 进程名, 状态, CPU时间(秒), 启动时间(开机后秒数), 常驻内存(字节))
+    """
+    with os.scandir('/proc') as entries:
+        pids = [int(entry.name) for entry in entries if entry.name.isdigit()]
+
+    for pid in pids:
+        stat = read_pid_stat(pid)
+        if stat is not None:
+            yield (pid,) + stat
+
+
+def read_mem_total() -> int:
+    """
+    读取 /proc/meminfo 中的物理内存总量
+
+    Returns:
+        物理内存总量（字节）
+    """
+    with open('/proc/meminfo', 'rb') as f:
+        for line in f:
+            if line.startswith(b'MemTotal:'):
+                return int(line.split()[1]) * 1024
+    raise OSError("/proc/meminfo 中没有 MemTotal")
+
+
+def read_meminfo() -> Dict[str, int]:
+    """
+    一次读取并解析整个 /proc/meminfo
+
+    Returns:
+        字段名 -> 字节数（原始数据单位为kB的字段已换算为字节）
+    """
+    with open('/proc/meminfo', 'rb') as f:
+        raw = f.read()
+
+    meminfo = {}
+    for line in raw.splitlines():
+        fields = line.split()
+        if len(fields) < 2:
+            continue
+        value = int(fields[1])
+        if len(fields) > 2:  # 单位 kB
+            value *= 1024
+        meminfo[fields[0].rstrip(b':').decode('ascii')] = value
+    return meminfo
+
+
+def read_memory() -> Tuple[int, int, int, float]:
+    """
+    计算物理内存使用情况（与psutil.virtual_memory()的可用内存口径一致）
+
+    已用内存按 总量-可用 计算，与新版psutil（及free命令的可用列）一致；
+    旧版psutil在Linux上按 总量-空闲-缓冲-缓存 计算，数值会偏小；
+    使用率两者均按 总量-可用 计算，不受影响。
+
+    Returns:
+        (总量, 已用, 可用, 使用率%)，单位为字节
+    """
+    meminfo = read_meminfo()
+    total = meminfo['MemTotal']
+
+    # 旧内核没有 MemAvailable 时用空闲+缓存+缓冲估算
+    available = meminfo.get('MemAvailable')
+    if available is None:
+        available = meminfo.get('MemFree', 0) + meminfo.get('Cached', 0) + meminfo.get('Buffers', 0)
+
+    used = total - available
+    percent = used / total * 100 if total else 0.0
+    return total, used, available, round(percent, 1)
+
+
+def count_pids() -> int:
+    """
+    统计当前进程数量（不构建PID列表）
+
+    Returns:
+        进程数量
+    """
+    with os.scandir('/proc') as entries:
+        return sum(1 for entry in entries if entry.name[0].isdigit())
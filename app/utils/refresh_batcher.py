@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+刷新请求合并工具
+同一事件循环周期内的重复刷新请求只执行一次，并可限制同类刷新的最小间隔
+"""
+
+from typing import Callable, Dict
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer
+
+
+class RefreshBatcher(QObject):
+    """刷新请求合并器"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._handlers: Dict[str, Callable[[], None]] = {}
+        self._pending: Dict[str, None] = {}  # 保持请求顺序的集合
+        self._scheduled = False
+
+    def register(self, key: str, handler: Callable[[], None]):
+        """
+        注册刷新处理函数
+
+        Args:
+            key: 刷新类型标识
+            handler: 实际执行刷新的函数
+        """
+        self._handlers[key] = handler
+
+    def add(self, key: str):
+        """
+        提交刷新请求，在下一次事件循环时统一执行
+
+        Args:
+            key: 刷新类型标识
+        """
+        self._pending[key] = None
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        """执行所有待处理的刷新请求"""
+        pending = list(self._pending)
+        self._pending.clear()
+        self._scheduled = False
+
+        for key in pending:
+            handler = self._handlers.get(key)
+            if handler:
+                handler()
+
+
+class RefreshThrottle:
+    """刷新节流器：同一类刷新在最小间隔内只放行一次"""
+
+    def __init__(self):
+        self._timers: Dict[str, QElapsedTimer] = {}
+
+    def ready(self, key: str, min_interval_ms: int) -> bool:
+        """
+        判断是否允许执行刷新，允许时重新开始计时
+
+        Args:
+            key: 刷新类型标识
+            min_interval_ms: 最小间隔（毫秒）
+
+        Returns:
+            是否允许刷新
+        """
+        timer = self._timers.get(key)
+        if timer is None:
+            timer = QElapsedTimer()
+            self._timers[key] = timer
+        elif timer.isValid() and timer.elapsed() < min_interval_ms:
+            return False
+
+        timer.start()
+        return True
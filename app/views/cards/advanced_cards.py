@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QBrush
 
-from app.views.ui_utils import StyledTableWidget, StyledButton, StyledGroupBox
+from app.views.ui_utils import StyledTableWidget, StyledButton, StyledGroupBox, bulk_fill, set_item_text
 
 
 class TemperatureMonitorCard(StyledGroupBox):
@@ -92,8 +92,16 @@ class BatteryMonitorCard(StyledGroupBox):
 
     refresh_requested = Signal()
 
+    # 电量进度条样式（低、中、高三档），导入时生成一次
+    _CHUNK_STYLE_PREFIX = "QProgressBar::chunk { background-color: "
+    _CHUNK_STYLE_SUFFIX = "; }"
+    LOW_STYLE = _CHUNK_STYLE_PREFIX + "#F44336" + _CHUNK_STYLE_SUFFIX
+    MEDIUM_STYLE = _CHUNK_STYLE_PREFIX + "#FF9800" + _CHUNK_STYLE_SUFFIX
+    HIGH_STYLE = _CHUNK_STYLE_PREFIX + "#4CAF50" + _CHUNK_STYLE_SUFFIX
+
     def __init__(self, parent=None):
         super().__init__("电池监控", parent)
+        self._current_style = None  # 当前应用的进度条样式
         self.init_ui()
 
     def init_ui(self):
@@ -120,6 +128,23 @@ class BatteryMonitorCard(StyledGroupBox):
         self.battery_bar.setValue(0)
         layout.addWidget(self.battery_bar)
 
+    @classmethod
+    def _battery_style(cls, percent: float) -> str:
+        """
+        根据电量选择进度条样式
+
+        Args:
+            percent: 电量百分比
+
+        Returns:
+            预先生成的样式表
+        """
+        if percent <= 20:
+            return cls.LOW_STYLE
+        if percent <= 50:
+            return cls.MEDIUM_STYLE
+        return cls.HIGH_STYLE
+
     def update_battery(self, battery_info: dict):
         """更新电池信息"""
         try:
@@ -135,13 +160,11 @@ class BatteryMonitorCard(StyledGroupBox):
             # 更新进度条
             self.battery_bar.setValue(int(percent))
 
-            # 根据电量设置颜色
-            if percent <= 20:
-                self.battery_bar.setStyleSheet("QProgressBar::chunk { background-color: #F44336; }")
-            elif percent <= 50:
-                self.battery_bar.setStyleSheet("QProgressBar::chunk { background-color: #FF9800; }")
-            else:
-                self.battery_bar.setStyleSheet("QProgressBar::chunk { background-color: #4CAF50; }")
+            # 根据电量设置颜色（档位不变时不重新设置样式表，避免重新polish）
+            style = self._battery_style(percent)
+            if style is not self._current_style:
+                self._current_style = style
+                self.battery_bar.setStyleSheet(style)
 
             # 更新文本
             info_text = f"<h2 style='text-align: center; color: #1976D2;'>{percent:.0f}%</h2>"
@@ -164,6 +187,14 @@ class ServicesMonitorCard(StyledGroupBox):
 
     def __init__(self, parent=None):
         super().__init__("系统服务", parent)
+
+        # 状态颜色画刷，所有行共享同一实例
+        self._running_brush = QBrush(Qt.GlobalColor.darkGreen)
+        self._stopped_brush = QBrush(Qt.GlobalColor.red)
+
+        # 列宽是否已按内容计算过
+        self._columns_sized = False
+
         self.init_ui()
 
     def init_ui(self):
@@ -198,24 +229,30 @@ class ServicesMonitorCard(StyledGroupBox):
                 self.table.setSpan(0, 0, 1, 3)
                 return
 
+            self.table.clearSpans()
             self.table.setRowCount(len(services))
 
-            for row, service in enumerate(services):
-                self.table.setItem(row, 0, QTableWidgetItem(service.get('name', 'N/A')))
-                self.table.setItem(row, 1, QTableWidgetItem(service.get('display_name', 'N/A')))
-
-                status_item = QTableWidgetItem(service.get('status', 'N/A'))
-
-                # 根据状态设置颜色
-                status = service.get('status', '')
-                if '运行' in status:
-                    status_item.setForeground(QBrush(Qt.GlobalColor.darkGreen))
-                elif '停止' in status:
-                    status_item.setForeground(QBrush(Qt.GlobalColor.red))
-
-                self.table.setItem(row, 2, status_item)
-
-            self.table.resizeColumnsToContents()
+            with bulk_fill(self.table):
+                # 原地复用已有单元格项，只为新增行分配新项
+                for row, service in enumerate(services):
+                    set_item_text(self.table, row, 0, service.get('name', 'N/A'))
+                    set_item_text(self.table, row, 1, service.get('display_name', 'N/A'))
+
+                    status_item = set_item_text(self.table, row, 2, service.get('status', 'N/A'))
+
+                    # 根据状态设置颜色（复用的单元格项需要清除上次的颜色）
+                    status = service.get('status', '')
+                    if '运行' in status:
+                        status_item.setForeground(self._running_brush)
+                    elif '停止' in status:
+                        status_item.setForeground(self._stopped_brush)
+                    else:
+                        status_item.setData(Qt.ItemDataRole.ForegroundRole, None)
+
+            # 只在首次填充数据后按内容计算一次列宽，之后的刷新保留当前列宽
+            if not self._columns_sized and services:
+                self.table.resizeColumnsToContents()
+                self._columns_sized = True
 
         except Exception as e:
             self.table.setRowCount(1)
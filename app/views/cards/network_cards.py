@@ -4,15 +4,107 @@
 网络监控相关卡片组件
 """
 
-from typing import List
+from typing import List, Sequence
 from PySide6.QtWidgets import (
-    QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QVBoxLayout, QHBoxLayout, QLabel, QComboBox
 )
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex, QTimer
 
 from app.models import NetworkConnection
-from app.views.ui_utils import StyledTableWidget, StyledButton, StyledGroupBox
+from app.views.ui_utils import (
+    StyledTableView, StyledButton, StyledGroupBox, set_column_widths,
+    batch_model_update, row_ranges
+)
+
+
+class NetworkTableModel(QAbstractTableModel):
+    """网络连接表格数据模型，视图只为可见单元格请求数据"""
+
+    HEADERS = ["协议", "本地地址", "远程地址", "状态", "PID"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[NetworkConnection] = []
+        self._rows_unique = True  # _rows 中各连接的标识是否互不相同（可按标识增量更新）
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        conn = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return conn.protocol
+        if column == 1:
+            return conn.local_addr
+        if column == 2:
+            return conn.remote_addr
+        if column == 3:
+            return conn.status
+        return str(conn.pid) if conn.pid else "N/A"
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def set_connections(self, connections: Sequence[NetworkConnection]):
+        """
+        按连接增量更新：删除已关闭的连接、原地更新状态变化的连接、追加新连接，
+        两次刷新间大部分连接不变，视图只需处理变化的部分
+
+        Args:
+            connections: 新的连接列表
+        """
+        new_by_key = {self._key(c): c for c in connections}
+        unique = len(new_by_key) == len(connections)
+        if not unique or not self._rows_unique:
+            # 新旧数据中存在标识相同的连接（如无权查看其他用户套接字时PID均为None），
+            # 无法按标识一一对应，整体替换
+            self.beginResetModel()
+            self._rows = list(connections)
+            self._rows_unique = unique
+            self.endResetModel()
+            return
+
+        # 删除已关闭的连接（从后往前按连续区间删除）
+        removed = [row for row, c in enumerate(self._rows) if self._key(c) not in new_by_key]
+        for first, last in reversed(row_ranges(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+
+        # 原地更新状态变化的行
+        changed = []
+        for row, old in enumerate(self._rows):
+            new = new_by_key.pop(self._key(old))
+            if new != old:
+                self._rows[row] = new
+                changed.append(row)
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1),
+                [Qt.ItemDataRole.DisplayRole]
+            )
+
+        # 追加新连接（剩下的都是新出现的连接）
+        if new_by_key:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_by_key) - 1)
+            self._rows.extend(new_by_key.values())
+            self.endInsertRows()
+
+    @staticmethod
+    def _key(conn: NetworkConnection) -> tuple:
+        """连接的标识：协议、两端地址和所属进程（状态可能变化，不参与标识）"""
+        return conn.protocol, conn.local_addr, conn.remote_addr, conn.pid
 
 
 class NetworkTableCard(StyledGroupBox):
@@ -23,6 +115,13 @@ class NetworkTableCard(StyledGroupBox):
     def __init__(self, parent=None):
         super().__init__("网络连接", parent)
         self.current_connections = []
+
+        # 刷新合并：过滤条件变化和新数据到达在120毫秒内只更新一次表格
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(120)
+        self._refresh_timer.timeout.connect(self._apply_filters)
+
         self.init_ui()
 
     def init_ui(self):
@@ -58,23 +157,12 @@ class NetworkTableCard(StyledGroupBox):
         layout.addLayout(control_layout)
 
         # 网络连接表格
-        self.table = StyledTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "协议", "本地地址", "远程地址", "状态", "PID"
-        ])
-
-        # 设置表格属性
-        self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-
-        # 设置列宽
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self.model = NetworkTableModel(self)
+        self.table = StyledTableView()
+        self.table.setModel(self.model)
+
+        # 设置列宽（固定初始宽度，刷新时不再按内容测量）
+        set_column_widths(self.table, {0: 60, 3: 110, 4: 70}, stretch_columns=(1, 2))
 
         layout.addWidget(self.table)
 
@@ -85,7 +173,7 @@ class NetworkTableCard(StyledGroupBox):
     def update_connections(self, connections: List[NetworkConnection]):
         """更新网络连接列表"""
         self.current_connections = connections
-        self._apply_filters()
+        self._refresh_timer.start()
         self.stats_label.setText(f"连接数: {len(connections)}")
 
     def _apply_filters(self):
@@ -109,15 +197,9 @@ class NetworkTableCard(StyledGroupBox):
             ]
 
         # 更新表格
-        self.table.setRowCount(len(filtered_connections))
-
-        for row, conn in enumerate(filtered_connections):
-            self.table.setItem(row, 0, QTableWidgetItem(conn.protocol))
-            self.table.setItem(row, 1, QTableWidgetItem(conn.local_addr))
-            self.table.setItem(row, 2, QTableWidgetItem(conn.remote_addr))
-            self.table.setItem(row, 3, QTableWidgetItem(conn.status))
-            self.table.setItem(row, 4, QTableWidgetItem(str(conn.pid) if conn.pid else "N/A"))
+        with batch_model_update(self.table):
+            self.model.set_connections(filtered_connections)
 
     def _on_filter_changed(self):
         """过滤器改变"""
-        self._apply_filters()
+        self._refresh_timer.start()
@@ -4,15 +4,200 @@
 进程管理相关卡片组件
 """
 
-from typing import List
+from typing import List, Optional, Sequence
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QComboBox, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
+    QComboBox, QMessageBox
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QTimer
 )
-from PySide6.QtCore import Signal
 
 from app.models import ProcessInfo
-from app.views.ui_utils import StyledTableWidget, StyledButton, StyledGroupBox
+from app.utils.async_worker import AsyncWorkerManager
+from app.views.ui_utils import (
+    StyledTableView, StyledButton, StyledGroupBox, set_column_widths,
+    batch_model_update, row_ranges
+)
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+
+def _format_row(proc: ProcessInfo) -> tuple:
+    """
+    格式化进程表格一行的显示文本
+
+    Args:
+        proc: 进程信息
+
+    Returns:
+        各列的显示文本
+    """
+    # 数值列使用 % 格式化（单个浮点数时比f-string更快）
+    return (
+        str(proc.pid), proc.name, "%.1f" % proc.cpu_percent,
+        "%.1f" % proc.memory_percent, "%.1f" % proc.memory_mb, proc.status
+    )
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """
+    进程表格数据模型，视图只为可见单元格请求数据
+
+    模型本身不排序，排序和过滤由 QSortFilterProxyModel 按 SORT_ROLE 完成；
+    行列表只整体替换、不原地修改，后台线程可以安全读取 rows 快照计算增量
+    """
+
+    HEADERS = ["PID", "进程名", "CPU%", "内存%", "内存(MB)", "状态"]
+
+    # 排序角色：返回原始数值，避免按格式化后的字符串排序
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[ProcessInfo] = []
+        self._display: List[tuple] = []  # 与 _rows 一一对应的各列显示文本
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # 绘制时视图会逐个查询字体、颜色、对齐等角色，先按角色排除，不取行数据
+        if role != _DISPLAY_ROLE and role != self.SORT_ROLE:
+            return None
+        if not index.isValid():
+            return None
+
+        # 显示文本在计算增量时已格式化好，重绘时直接取用
+        if role == _DISPLAY_ROLE:
+            return self._display[index.row()][index.column()]
+
+        proc = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return proc.pid
+        if column == 1:
+            return proc.name
+        if column == 2:
+            return proc.cpu_percent
+        if column == 3:
+            return proc.memory_percent
+        if column == 4:
+            return proc.memory_mb
+        return proc.status
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    @property
+    def rows(self) -> List[ProcessInfo]:
+        """当前的行列表（只读快照）"""
+        return self._rows
+
+    @property
+    def display(self) -> List[tuple]:
+        """当前各行的显示文本（只读快照，与 rows 一一对应）"""
+        return self._display
+
+    @staticmethod
+    def diff_rows(old_rows: Sequence[ProcessInfo], old_display: Sequence[tuple],
+                  processes: Sequence[ProcessInfo]) -> tuple:
+        """
+        按PID计算增量更新，并为内容变化的行和新增行格式化显示文本
+        （不访问模型，可在后台线程执行）
+
+        Args:
+            old_rows: 模型当前的行列表快照
+            old_display: 模型当前的显示文本快照
+            processes: 新的进程列表
+
+        Returns:
+            (old_rows, 删除区间列表, 删除后的新行列表, 内容变化的行号, 新增进程列表, 全部行的显示文本)
+        """
+        new_by_pid = {p.pid: p for p in processes}
+
+        removed = []
+        kept = []
+        changed = []
+        display = []
+        for i, old in enumerate(old_rows):
+            new = new_by_pid.pop(old.pid, None)
+            if new is None:
+                removed.append(i)
+                continue
+            if new is not old and new != old:
+                changed.append(len(kept))
+                display.append(_format_row(new))
+            else:
+                # 内容未变的行沿用上次格式化的文本
+                display.append(old_display[i])
+            kept.append(new)
+
+        # 剩下的都是新出现的PID
+        added = list(new_by_pid.values())
+        display.extend(map(_format_row, added))
+        return old_rows, row_ranges(removed), kept, changed, added, display
+
+    def apply_diff(self, diff: tuple) -> bool:
+        """
+        应用 diff_rows 的结果：删除已退出的行、更新已有行、追加新行，
+        代理模型据此重新排序过滤，视图的选中项和滚动位置得以保留
+
+        Args:
+            diff: diff_rows 的返回值
+
+        Returns:
+            是否已应用（计算增量后模型又被更新过时返回False）
+        """
+        old_rows, removed, kept, changed, added, display = diff
+        if old_rows is not self._rows:
+            return False
+
+        # 删除已退出的进程（从后往前按连续区间删除，每次生成新列表）
+        for first, last in reversed(removed):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._rows = self._rows[:first] + self._rows[last + 1:]
+            self._display = self._display[:first] + self._display[last + 1:]
+            self.endRemoveRows()
+
+        # 更新内容变化的行
+        self._rows = kept
+        self._display = display[:len(kept)]
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1),
+                [Qt.ItemDataRole.DisplayRole, self.SORT_ROLE]
+            )
+
+        # 追加新进程
+        if added:
+            first = len(kept)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows = kept + added
+            self._display = display
+            self.endInsertRows()
+        return True
+
+    def set_processes(self, processes: Sequence[ProcessInfo]):
+        """
+        在当前线程计算并应用增量更新
+
+        Args:
+            processes: 新的进程列表
+        """
+        self.apply_diff(self.diff_rows(self._rows, self._display, processes))
+
+    def process_at(self, row: int) -> Optional[ProcessInfo]:
+        """获取指定行的进程信息（源模型行号）"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
 
 
 class ProcessTableCard(StyledGroupBox):
@@ -21,11 +206,17 @@ class ProcessTableCard(StyledGroupBox):
     # 信号定义
     refresh_requested = Signal()
     kill_requested = Signal(int, bool)  # pid, force
+    search_changed = Signal(str)  # 搜索文本
+    sort_key_changed = Signal(str)  # 选取进程所依据的指标（'cpu_percent' 或 'memory_percent'）
 
     def __init__(self, parent=None):
         super().__init__("进程管理", parent)
-        self.current_processes = []
-        self.filtered_processes = []
+        self.current_processes = ()
+        self._diffing = ()  # 正在计算增量的进程列表
+
+        # 在后台线程计算表格增量，界面线程只应用结果
+        self.worker_manager = AsyncWorkerManager(self)
+
         self.init_ui()
 
     def init_ui(self):
@@ -35,11 +226,23 @@ class ProcessTableCard(StyledGroupBox):
         # 控制栏
         control_layout = QHBoxLayout()
 
+        # 搜索防抖：停止输入250毫秒后再通知控制器按名称过滤
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._on_search_changed)
+
+        # 本地过滤合并：连续输入时120毫秒内只重新过滤一次
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._apply_search_filter)
+
         # 搜索框
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("搜索进程...")
         self.search_box.setFixedWidth(200)
-        self.search_box.textChanged.connect(self._on_search_changed)
+        self.search_box.textChanged.connect(self._on_search_text_changed)
         control_layout.addWidget(self.search_box)
 
         # 排序选择
@@ -59,28 +262,31 @@ class ProcessTableCard(StyledGroupBox):
         layout.addLayout(control_layout)
 
         # 进程表格
-        self.table = StyledTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "PID", "进程名", "CPU%", "内存%", "内存(MB)", "状态"
-        ])
+        self.model = ProcessTableModel(self)
+
+        # 代理模型负责排序和按进程名过滤，输入时无需重建数据
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(ProcessTableModel.SORT_ROLE)
+        self.proxy.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.proxy.setFilterKeyColumn(1)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+        self.table = StyledTableView()
+        self.table.setModel(self.proxy)
 
         # 设置表格属性
-        self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.table.setSortingEnabled(True)
+        self.table.sortByColumn(2, Qt.SortOrder.DescendingOrder)
+        self._sort_key = 'cpu_percent'
+        self.table.horizontalHeader().sortIndicatorChanged.connect(self._on_sort_indicator_changed)
 
-        # 设置列宽
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        # 设置列宽（固定初始宽度，刷新时不再按内容测量）
+        set_column_widths(self.table, {0: 70, 2: 70, 3: 70, 4: 90, 5: 90}, stretch_columns=(1,))
 
         # 选择变化
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.proxy.modelReset.connect(self._on_selection_changed)
 
         layout.addWidget(self.table)
 
@@ -110,58 +316,74 @@ class ProcessTableCard(StyledGroupBox):
 
         layout.addLayout(button_layout)
 
-    def update_processes(self, processes: List[ProcessInfo]):
+    def update_processes(self, processes: Sequence[ProcessInfo]):
         """更新进程列表"""
         self.current_processes = processes
-        self._apply_filter_and_sort()
         self.stats_label.setText(f"进程数: {len(processes)}")
 
-    def _apply_filter_and_sort(self):
-        """应用过滤和排序"""
-        # 过滤
-        search_text = self.search_box.text().lower()
-        if search_text:
-            self.filtered_processes = [
-                p for p in self.current_processes
-                if search_text in p.name.lower()
-            ]
-        else:
-            self.filtered_processes = self.current_processes.copy()
-
-        # 排序
-        sort_key_map = {
-            "CPU使用率": lambda x: x.cpu_percent,
-            "内存使用率": lambda x: x.memory_percent,
-            "进程名": lambda x: x.name.lower(),
-            "PID": lambda x: x.pid
-        }
-
-        sort_key = sort_key_map.get(self.sort_combo.currentText(), lambda x: x.cpu_percent)
-        reverse = self.sort_combo.currentText() in ["CPU使用率", "内存使用率"]
-        self.filtered_processes.sort(key=sort_key, reverse=reverse)
-
-        # 更新表格
-        self.table.setRowCount(len(self.filtered_processes))
-
-        for row, proc in enumerate(self.filtered_processes):
-            self.table.setItem(row, 0, QTableWidgetItem(str(proc.pid)))
-            self.table.setItem(row, 1, QTableWidgetItem(proc.name))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{proc.cpu_percent:.1f}"))
-            self.table.setItem(row, 3, QTableWidgetItem(f"{proc.memory_percent:.1f}"))
-            self.table.setItem(row, 4, QTableWidgetItem(f"{proc.memory_mb:.1f}"))
-            self.table.setItem(row, 5, QTableWidgetItem(proc.status))
+        # 上一次增量计算的结果尚未应用时不再提交，应用后再按最新的进程列表计算
+        if not self.worker_manager.is_busy('diff_rows'):
+            self._submit_diff()
+
+    def _submit_diff(self):
+        """以模型当前的行为基准，在后台计算到最新进程列表的增量"""
+        self._diffing = self.current_processes
+        self.worker_manager.execute(
+            'diff_rows',
+            ProcessTableModel.diff_rows,
+            self._on_rows_diffed,
+            lambda e: self._on_rows_diffed(None),
+            self.model.rows, self.model.display, self._diffing
+        )
+
+    def _on_rows_diffed(self, diff: Optional[tuple]):
+        """增量计算完成：应用到模型，模型已变化或计算失败时在界面线程重新计算"""
+        with batch_model_update(self.table, self.proxy):
+            if diff is None or not self.model.apply_diff(diff):
+                self.model.set_processes(self.current_processes)
+                self._diffing = self.current_processes
+
+        # 计算期间又收到了新的进程列表：以刚更新的模型为基准再计算一次
+        if self.current_processes is not self._diffing:
+            self._submit_diff()
+
+    def _on_search_text_changed(self, text: str):
+        """搜索文本改变：短暂合并后在本地过滤，防抖后再通知控制器"""
+        self._filter_timer.start()
+        self._search_timer.start()
+
+    def _apply_search_filter(self):
+        """按当前搜索文本过滤表格"""
+        self.proxy.setFilterFixedString(self.search_box.text().strip())
 
     def _on_search_changed(self):
-        """搜索文本改变"""
-        self._apply_filter_and_sort()
+        """搜索文本稳定后通知控制器"""
+        self.search_changed.emit(self.search_box.text())
 
     def _on_sort_changed(self):
         """排序方式改变"""
-        self._apply_filter_and_sort()
+        sort_column_map = {
+            "CPU使用率": (2, Qt.SortOrder.DescendingOrder),
+            "内存使用率": (3, Qt.SortOrder.DescendingOrder),
+            "进程名": (1, Qt.SortOrder.AscendingOrder),
+            "PID": (0, Qt.SortOrder.AscendingOrder)
+        }
+
+        column, order = sort_column_map.get(
+            self.sort_combo.currentText(), (2, Qt.SortOrder.DescendingOrder)
+        )
+        self.table.sortByColumn(column, order)
+
+    def _on_sort_indicator_changed(self, column: int, order):
+        """排序列改变：按内存列（内存%、内存(MB)）排序时让控制器按内存选取进程，其余列按CPU选取"""
+        sort_key = 'memory_percent' if column in (3, 4) else 'cpu_percent'
+        if sort_key != self._sort_key:
+            self._sort_key = sort_key
+            self.sort_key_changed.emit(sort_key)
 
     def _on_selection_changed(self):
         """选择改变"""
-        has_selection = len(self.table.selectedItems()) > 0
+        has_selection = self.table.selectionModel().hasSelection()
         self.kill_btn.setEnabled(has_selection)
         self.force_kill_btn.setEnabled(has_selection)
         self.details_btn.setEnabled(has_selection)
@@ -176,32 +398,32 @@ class ProcessTableCard(StyledGroupBox):
 
     def _kill_process(self, force: bool):
         """结束进程"""
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            pid_item = self.table.item(current_row, 0)
-            name_item = self.table.item(current_row, 1)
-
-            if pid_item and name_item:
-                pid = int(pid_item.text())
-                name = name_item.text()
+        process = self._current_process()
+        if process:
+            pid = process.pid
+            name = process.name
 
-                action_text = "强制结束" if force else "结束"
-                reply = QMessageBox.question(
-                    self, "确认操作",
-                    f"确定要{action_text}进程 {name} (PID: {pid}) 吗？",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
+            action_text = "强制结束" if force else "结束"
+            reply = QMessageBox.question(
+                self, "确认操作",
+                f"确定要{action_text}进程 {name} (PID: {pid}) 吗？",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
 
-                if reply == QMessageBox.StandardButton.Yes:
-                    self.kill_requested.emit(pid, force)
+            if reply == QMessageBox.StandardButton.Yes:
+                self.kill_requested.emit(pid, force)
 
     def _on_details_clicked(self):
         """显示进程详情"""
-        current_row = self.table.currentRow()
-        if current_row >= 0 and current_row < len(self.filtered_processes):
-            process = self.filtered_processes[current_row]
+        process = self._current_process()
+        if process:
             self._show_process_details(process)
 
+    def _current_process(self) -> Optional[ProcessInfo]:
+        """获取当前选中行对应的进程信息"""
+        index = self.proxy.mapToSource(self.table.currentIndex())
+        return self.model.process_at(index.row()) if index.isValid() else None
+
     def _show_process_details(self, process: ProcessInfo):
         """显示进程详细信息"""
         details = f"""进程详细信息:
@@ -17,6 +17,7 @@ class SystemOverviewCard(StyledGroupBox):
     def __init__(self, parent=None):
         super().__init__("系统概览", parent)
         self.setFixedHeight(180)
+        self._shown = {}  # 指标标识 -> 上次显示的 (文本, 数值)
         self.init_ui()
 
     def init_ui(self):
@@ -62,20 +63,37 @@ class SystemOverviewCard(StyledGroupBox):
         """更新系统信息"""
         # CPU
         cpu_percent = int(info.cpu_percent)
-        self.cpu_value.setText(f"{cpu_percent}%")
-        self.cpu_progress.setValue(cpu_percent)
+        self._set_metric('cpu', self.cpu_value, self.cpu_progress, f"{cpu_percent}%", cpu_percent)
 
         # 内存
         memory_percent = int(info.memory_percent)
         memory_gb = info.memory_used / (1024**3)
-        self.memory_value.setText(f"{memory_percent}% ({memory_gb:.1f}GB)")
-        self.memory_progress.setValue(memory_percent)
+        self._set_metric('memory', self.memory_value, self.memory_progress,
+                         f"{memory_percent}% ({memory_gb:.1f}GB)", memory_percent)
 
         # 磁盘
         disk_percent = int(info.disk_percent)
         disk_gb = info.disk_used / (1024**3)
-        self.disk_value.setText(f"{disk_percent}% ({disk_gb:.1f}GB)")
-        self.disk_progress.setValue(disk_percent)
+        self._set_metric('disk', self.disk_value, self.disk_progress,
+                         f"{disk_percent}% ({disk_gb:.1f}GB)", disk_percent)
+
+    def _set_metric(self, key: str, label: QLabel, progress: QProgressBar, text: str, value: int):
+        """
+        更新一项指标，显示内容与上次相同时跳过（整数百分比多数时候不变）
+
+        Args:
+            key: 指标标识
+            label: 数值标签
+            progress: 进度条
+            text: 标签文本
+            value: 进度条数值
+        """
+        last_text, last_value = self._shown.get(key, (None, None))
+        if text != last_text:
+            label.setText(text)
+        if value != last_value:
+            progress.setValue(value)
+        self._shown[key] = (text, value)
 
 
 class SystemStatsCard(StyledGroupBox):
@@ -84,6 +102,7 @@ class SystemStatsCard(StyledGroupBox):
     def __init__(self, parent=None):
         super().__init__("系统统计", parent)
         self.setFixedHeight(100)
+        self._shown = ()  # 上次显示的 (启动时间, 运行时间, 进程数, CPU核心数)
         self.init_ui()
 
     def init_ui(self):
@@ -108,10 +127,21 @@ class SystemStatsCard(StyledGroupBox):
 
     def update_system_info(self, info: SystemInfo):
         """更新系统统计信息"""
-        self.boot_time_label.setText(f"启动时间: {info.boot_time}")
-        self.uptime_label.setText(f"运行时间: {info.uptime}")
-        self.process_count_label.setText(f"进程数: {info.process_count}")
-        self.cpu_count_label.setText(f"CPU核心: {info.cpu_count}")
+        # 启动时间和CPU核心数运行期间不变，运行时间按分钟变化，只更新有变化的标签
+        values = (info.boot_time, info.uptime, info.process_count, info.cpu_count)
+        if values == self._shown:
+            return
+
+        last = self._shown or (None,) * len(values)
+        if values[0] != last[0]:
+            self.boot_time_label.setText(f"启动时间: {info.boot_time}")
+        if values[1] != last[1]:
+            self.uptime_label.setText(f"运行时间: {info.uptime}")
+        if values[2] != last[2]:
+            self.process_count_label.setText(f"进程数: {info.process_count}")
+        if values[3] != last[3]:
+            self.cpu_count_label.setText(f"CPU核心: {info.cpu_count}")
+        self._shown = values
 
 
 class SystemInfoCard(StyledGroupBox):
@@ -4,16 +4,114 @@
 流量监控相关卡片组件
 """
 
-from typing import List
+from typing import List, Sequence
 from PySide6.QtWidgets import (
-    QVBoxLayout, QHBoxLayout, QLabel, QGridLayout,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QVBoxLayout, QHBoxLayout, QLabel, QGridLayout
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
-from PySide6.QtCore import Qt, Signal
 
 from app.models import format_bytes
 from app.controllers.traffic_controller import ProcessTrafficInfo
-from app.views.ui_utils import StyledTableWidget, StyledButton, StyledGroupBox
+from app.views.ui_utils import (
+    StyledTableView, StyledButton, StyledGroupBox, set_column_widths,
+    batch_model_update, row_ranges
+)
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+
+class ProcessTrafficTableModel(QAbstractTableModel):
+    """进程流量表格数据模型，视图只为可见单元格请求数据，排序由代理模型完成"""
+
+    HEADERS = ["PID", "进程名", "连接数", "读取", "写入"]
+
+    # 排序角色：返回原始数值，避免按格式化后的字符串排序
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[ProcessTrafficInfo] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # 绘制时视图会逐个查询字体、颜色、对齐等角色，先按角色排除，不取行数据
+        if role != _DISPLAY_ROLE and role != self.SORT_ROLE:
+            return None
+        if not index.isValid():
+            return None
+
+        traffic = self._rows[index.row()]
+        column = index.column()
+
+        if role == self.SORT_ROLE:
+            if column == 0:
+                return traffic.pid
+            if column == 1:
+                return traffic.name
+            if column == 2:
+                return traffic.connections_count
+            if column == 3:
+                return traffic.bytes_recv
+            return traffic.bytes_sent
+
+        if column == 0:
+            return str(traffic.pid)
+        if column == 1:
+            return traffic.name
+        if column == 2:
+            return str(traffic.connections_count)
+        if column == 3:
+            return format_bytes(traffic.bytes_recv)
+        return format_bytes(traffic.bytes_sent)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def set_traffic(self, traffic_list: Sequence[ProcessTrafficInfo]):
+        """
+        按PID增量更新：删除已消失的行、原地更新已有行、追加新行
+
+        Args:
+            traffic_list: 新的进程流量列表
+        """
+        new_by_pid = {traffic.pid: traffic for traffic in traffic_list}
+
+        # 删除已消失的进程（从后往前按连续区间删除，行号不受影响）
+        removed = [row for row, t in enumerate(self._rows) if t.pid not in new_by_pid]
+        for first, last in reversed(row_ranges(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+
+        # 原地更新内容变化的行
+        changed = []
+        for row, old in enumerate(self._rows):
+            new = new_by_pid.pop(old.pid)
+            if new != old:
+                self._rows[row] = new
+                changed.append(row)
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1),
+                [Qt.ItemDataRole.DisplayRole, self.SORT_ROLE]
+            )
+
+        # 追加新进程（剩下的都是新出现的PID）
+        if new_by_pid:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_by_pid) - 1)
+            self._rows.extend(new_by_pid.values())
+            self.endInsertRows()
 
 
 class TrafficMonitorCard(StyledGroupBox):
@@ -135,25 +233,17 @@ class ProcessTrafficCard(StyledGroupBox):
         layout.addLayout(control_layout)
 
         # 进程流量表格
-        self.table = StyledTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "PID", "进程名", "连接数", "读取", "写入"
-        ])
-
-        # 设置表格属性
-        self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSortingEnabled(True)
+        self.model = ProcessTrafficTableModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(ProcessTrafficTableModel.SORT_ROLE)
 
-        # 设置列宽
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self.table = StyledTableView()
+        self.table.setModel(self.proxy)
+        self.table.setSortingEnabled(True)
 
+        # 设置列宽（固定初始宽度，刷新时不再按内容测量）
+        set_column_widths(self.table, {0: 70, 2: 70, 3: 100, 4: 100}, stretch_columns=(1,))
         layout.addWidget(self.table)
 
         # 统计信息
@@ -166,14 +256,7 @@ class ProcessTrafficCard(StyledGroupBox):
 
         # 只显示前50个（性能考虑）
         display_list = traffic_list[:50]
-
-        self.table.setRowCount(len(display_list))
-
-        for row, traffic in enumerate(display_list):
-            self.table.setItem(row, 0, QTableWidgetItem(str(traffic.pid)))
-            self.table.setItem(row, 1, QTableWidgetItem(traffic.name))
-            self.table.setItem(row, 2, QTableWidgetItem(str(traffic.connections_count)))
-            self.table.setItem(row, 3, QTableWidgetItem(format_bytes(traffic.bytes_recv)))
-            self.table.setItem(row, 4, QTableWidgetItem(format_bytes(traffic.bytes_sent)))
+        with batch_model_update(self.table, self.proxy):
+            self.model.set_traffic(display_list)
 
         self.stats_label.setText(f"显示进程: {len(display_list)} / 总计: {len(traffic_list)}")
@@ -6,12 +6,15 @@
 """
 
 import sys
-import platform
+import random
+import signal
+import socket
+import traceback
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QMenuBar, QMenu, QStatusBar, QMessageBox
+    QTabWidget, QMenuBar, QMenu, QStatusBar, QMessageBox, QStyleFactory
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal, QSocketNotifier
 from PySide6.QtGui import QAction
 
 from app.controllers import (
@@ -19,7 +22,8 @@ from app.controllers import (
     ProcessController,
     NetworkController,
     HardwareController,
-    TrafficMonitorController
+    TrafficMonitorController,
+    AdvancedMonitorController
 )
 from app.views.ui_components import (
     SystemOverviewCard,
@@ -35,9 +39,19 @@ from app.views.ui_components import (
     BatteryMonitorCard,
     ServicesMonitorCard
 )
+from app.utils import AsyncWorkerManager, RefreshBatcher, RefreshThrottle, platform_info
 from app.views.ui_utils import (
-    show_success_message,
-    show_error_message
+    ErrorBus,
+    suspend_updates,
+    show_success_message
+)
+
+# 关于对话框使用的平台信息
+_PLATFORM_SUMMARY = (
+    platform_info.SYSTEM,
+    platform_info.RELEASE,
+    platform_info.PYTHON_VERSION,
+    platform_info.ARCHITECTURE_BITS,
 )
 
 
@@ -112,6 +126,9 @@ class SystemMonitorInterface(QWidget):
 
 class ProcessInterface(QWidget):
     """进程管理界面"""
+
+    # 界面显示/隐藏时发出，用于控制器跳过无人查看时的刷新
+    visibility_changed = Signal(bool)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -130,6 +147,16 @@ class ProcessInterface(QWidget):
         """更新进程列表"""
         self.process_card.update_processes(processes)
 
+    def showEvent(self, event):
+        """界面显示"""
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event):
+        """界面隐藏"""
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+
 
 class NetworkInterface(QWidget):
     """网络监控界面"""
@@ -205,6 +232,67 @@ class ServicesInterface(QWidget):
 
 class MainWindow(QMainWindow):
     """系统监控主窗口（MVC架构）"""
+
+    # 各标签页自动刷新间隔（毫秒），未列出的标签页不自动刷新
+    TAB_REFRESH_INTERVALS = {
+        'system_monitor': 10000,  # 温度、电池
+        'process': 3000,
+        'network': 5000,
+        'services': 30000,
+    }
+
+    # 数据连续无变化时，自动刷新间隔每次乘以该系数，最多退避到基础间隔的上限倍数
+    REFRESH_BACKOFF_FACTOR = 1.5
+    REFRESH_BACKOFF_MAX = 3.0
+
+    # 数据键 -> 负责刷新该数据的标签页（收到变化的数据时复位该标签页的退避）
+    REFRESH_DATA_TABS = {
+        'temperature': 'system_monitor_interface',
+        'battery': 'system_monitor_interface',
+        'processes': 'process_interface',
+        'connections': 'network_interface',
+        'services': 'services_interface',
+    }
+
+    # 手动刷新的最小间隔（毫秒）
+    MANUAL_REFRESH_INTERVAL = 500
+
+    # 启动时并行加载的数据，全部到达后提示初始化完成
+    INITIAL_DATA_KEYS = ('processes', 'connections', 'temperature', 'battery', 'services')
+
+    # 按内容哈希判断是否变化的数据键：只用于很少变化的小数据；
+    # 进程、连接、流量等大列表直接推送（进程列表已由控制器按签名去重）
+    HASH_CHECKED_KEYS = frozenset(('system_info', 'hardware'))
+
+    # 状态栏提示的显示时长（毫秒）
+    STATUS_MESSAGE_TIMEOUT = 2000
+
+    # 标签页定义（按显示顺序）：(界面属性名, 界面类, 标题)
+    TABS = [
+        ('system_info_interface', SystemInfoInterface, "系统信息"),
+        ('system_monitor_interface', SystemMonitorInterface, "系统监控"),
+        ('process_interface', ProcessInterface, "进程管理"),
+        ('network_interface', NetworkInterface, "网络监控"),
+        ('traffic_interface', TrafficInterface, "流量监控"),
+        ('services_interface', ServicesInterface, "系统服务"),
+    ]
+
+    # 各界面接收的数据：界面属性名 -> [(数据键, 界面更新方法名)]
+    TAB_DATA = {
+        'system_info_interface': [('system_info', 'update_system_info')],
+        'system_monitor_interface': [
+            ('system_info', 'update_system_info'),
+            ('temperature', 'update_temperature'),
+            ('battery', 'update_battery'),
+        ],
+        'process_interface': [('processes', 'update_processes')],
+        'network_interface': [('connections', 'update_connections')],
+        'traffic_interface': [
+            ('traffic', 'update_traffic'),
+            ('process_traffic', 'update_process_traffic'),
+        ],
+        'services_interface': [('services', 'update_services')],
+    }
     
     def __init__(self):
         super().__init__()
@@ -212,15 +300,49 @@ class MainWindow(QMainWindow):
         # 设置窗口属性
         self.setWindowTitle("系统监控与进程管理工具")
         self.resize(1200, 800)
+
+        # 标签页刷新定时器（界面属性名 -> QTimer），只有当前标签页的定时器运行
+        self._tab_timers = {}
+        self._tab_intervals = {}  # 标签页 -> 基础刷新间隔（毫秒）
+        self._tab_backoff = {}  # 标签页 -> 当前退避倍数
+        self._tab_refreshers = {}  # 标签页 -> 定时刷新调用的方法
+
+        # 各标签页界面在首次切换到时才创建，之前为None
+        for attr, _, _ in self.TABS:
+            setattr(self, attr, None)
+
+        # 各类数据的最新值，界面创建后立即回放
+        self._latest = {}
+
+        # 同一事件循环周期内到达的数据合并为一次界面更新
+        self._pending_updates = {}
+
+        # 数据键 -> 已创建界面的绑定更新方法，界面创建时登记一次
+        self._update_handlers = {}
+
+        # 各类数据上次推送内容的哈希，内容不变时跳过界面更新
+        self._last_hashes = {}
+        
+        # 尚未到达的初始数据
+        self._initial_pending = set()
+
+        # 界面和首次数据加载推迟到窗口第一次显示之后
+        self._first_shown = False
+
+        # 关于对话框，首次打开时创建
+        self._about_dialog = None
         
         # 初始化控制器
         self.init_controllers()
-        
-        # 延迟初始化UI（减少启动阻塞）
-        QTimer.singleShot(0, self._delayed_init)
-        
-        # 居中显示
-        self.center_window()
+
+    def showEvent(self, event):
+        """窗口显示事件：首次显示后再初始化界面并加载数据"""
+        super().showEvent(event)
+        if not self._first_shown:
+            self._first_shown = True
+            # 窗口映射后边框尺寸才准确，此时再居中
+            self.center_window()
+            QTimer.singleShot(0, self._delayed_init)
     
     def _delayed_init(self):
         """延迟初始化UI和信号连接"""
@@ -228,8 +350,8 @@ class MainWindow(QMainWindow):
         self.init_menu()
         self.connect_signals()
         
-        # 再延迟启动监控
-        QTimer.singleShot(100, self.start_monitoring)
+        # 界面已构建完成，直接启动监控（数据获取都在后台线程中进行）
+        self.start_monitoring()
     
     def init_controllers(self):
         """初始化控制器"""
@@ -238,6 +360,20 @@ class MainWindow(QMainWindow):
         self.network_controller = NetworkController()
         self.hardware_controller = HardwareController()
         self.traffic_controller = TrafficMonitorController()
+        self.advanced_controller = AdvancedMonitorController()
+
+        # 合并同一事件循环周期内的重复刷新请求
+        self._batch = RefreshBatcher(self)
+        self._batch.register('processes', lambda: self.process_controller.get_processes(force_refresh=True))
+        self._batch.register('network', lambda: self.network_controller.get_connections(force_refresh=True))
+        self._batch.register('hardware', lambda: self.hardware_controller.get_hardware_info(force_refresh=True))
+        self._batch.register('process_traffic', self.traffic_controller.get_process_traffic)
+
+        # 手动刷新节流，连续点击刷新按钮时最多每500毫秒执行一次
+        self._throttle = RefreshThrottle()
+
+        # 错误提示去重，避免同一错误连续弹出多个对话框
+        self._error_bus = ErrorBus(self)
     
     def init_ui(self):
         """初始化界面"""
@@ -248,24 +384,11 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # 创建标签页
+        # 创建标签页（先用占位部件，真实界面在首次切换到时创建）
         self.tab_widget = QTabWidget()
-        
-        # 创建各个界面
-        self.system_info_interface = SystemInfoInterface()
-        self.system_monitor_interface = SystemMonitorInterface()
-        self.process_interface = ProcessInterface()
-        self.network_interface = NetworkInterface()
-        self.traffic_interface = TrafficInterface()
-        self.services_interface = ServicesInterface()
-
-        # 添加标签页
-        self.tab_widget.addTab(self.system_info_interface, "系统信息")
-        self.tab_widget.addTab(self.system_monitor_interface, "系统监控")
-        self.tab_widget.addTab(self.process_interface, "进程管理")
-        self.tab_widget.addTab(self.network_interface, "网络监控")
-        self.tab_widget.addTab(self.traffic_interface, "流量监控")
-        self.tab_widget.addTab(self.services_interface, "系统服务")
+        for _, _, title in self.TABS:
+            self.tab_widget.addTab(QWidget(), title)
+        self._ensure_tab(self.tab_widget.currentIndex())
         
         layout.addWidget(self.tab_widget)
         
@@ -273,6 +396,7 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("就绪")
+        self._show_message = self.status_bar.showMessage
     
     def init_menu(self):
         """初始化菜单栏"""
@@ -328,34 +452,241 @@ class MainWindow(QMainWindow):
         self.traffic_controller.process_traffic_updated.connect(self.on_process_traffic_updated)
         self.traffic_controller.error_occurred.connect(self.on_error)
 
-        # 界面组件信号
-        self.process_interface.process_card.refresh_requested.connect(self.refresh_processes)
-        self.process_interface.process_card.kill_requested.connect(self.kill_process)
-
-        self.network_interface.network_card.refresh_requested.connect(self.refresh_network)
+        # 高级监控信号
+        self.advanced_controller.temperature_updated.connect(self.on_temperature_updated)
+        self.advanced_controller.battery_updated.connect(self.on_battery_updated)
+        self.advanced_controller.services_updated.connect(self.on_services_updated)
+        self.advanced_controller.error_occurred.connect(self.on_error)
+
+    def _ensure_tab(self, index: int):
+        """
+        确保指定标签页的真实界面已创建，首次调用时替换占位部件
+
+        Args:
+            index: 标签页索引
+        """
+        attr, interface_class, title = self.TABS[index]
+        if getattr(self, attr) is not None:
+            return
+
+        interface = interface_class()
+        setattr(self, attr, interface)
+        self._connect_interface_signals(attr)
+
+        # 替换占位部件，期间屏蔽currentChanged避免重入
+        placeholder = self.tab_widget.widget(index)
+        current_index = self.tab_widget.currentIndex()
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, interface, title)
+        self.tab_widget.setCurrentIndex(current_index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        # 登记绑定的更新方法，并回放已获取的最新数据
+        with suspend_updates(interface):
+            for key, method in self.TAB_DATA[attr]:
+                handler = getattr(interface, method)
+                self._update_handlers.setdefault(key, []).append(handler)
+                if key in self._latest:
+                    handler(self._latest[key])
+
+    def _connect_interface_signals(self, attr: str):
+        """
+        连接界面组件信号
+
+        Args:
+            attr: 界面属性名
+        """
+        if attr == 'process_interface':
+            self.process_interface.visibility_changed.connect(self.on_process_visibility_changed)
+            self.process_interface.process_card.refresh_requested.connect(self.refresh_processes)
+            self.process_interface.process_card.kill_requested.connect(self.kill_process)
+            self.process_interface.process_card.search_changed.connect(self.on_process_search_changed)
+            self.process_interface.process_card.sort_key_changed.connect(self.on_process_sort_key_changed)
+        elif attr == 'network_interface':
+            self.network_interface.network_card.refresh_requested.connect(self.refresh_network)
+        elif attr == 'traffic_interface':
+            self.traffic_interface.process_traffic_card.refresh_requested.connect(self.refresh_process_traffic)
+        elif attr == 'system_monitor_interface':
+            self.system_monitor_interface.temperature_card.refresh_requested.connect(self.refresh_temperature)
+            self.system_monitor_interface.battery_card.refresh_requested.connect(self.refresh_battery)
+        elif attr == 'services_interface':
+            self.services_interface.services_card.refresh_requested.connect(self.refresh_services)
+
+    def _dispatch(self, key: str, payload):
+        """
+        缓存最新数据，并在下一次事件循环时推送给已创建的界面
+
+        Args:
+            key: 数据键
+            payload: 数据
+        """
+        self._mark_initial_loaded(key)
+        if not self._is_changed(key, payload):
+            return
+
+        tab = self.REFRESH_DATA_TABS.get(key)
+        if tab is not None:
+            self._reset_backoff(tab)
+
+        self._latest[key] = payload
+        if not self._pending_updates:
+            QTimer.singleShot(0, self._flush_updates)
+        self._pending_updates[key] = payload
+
+    def _is_changed(self, key: str, payload) -> bool:
+        """
+        判断数据与上次相比是否变化
+
+        控制器在缓存有效期内会重复发送同一对象，按对象身份即可判断；
+        只有 HASH_CHECKED_KEYS 中的小数据才进一步按内容哈希比较
+
+        Args:
+            key: 数据键
+            payload: 数据
+
+        Returns:
+            数据是否变化
+        """
+        if payload is self._latest.get(key):
+            return False
+        if key not in self.HASH_CHECKED_KEYS:
+            return True
+
+        payload_hash = hash(repr(payload))
+        if self._last_hashes.get(key) == payload_hash:
+            return False
+        self._last_hashes[key] = payload_hash
+        return True
+
+    def _flush_updates(self):
+        """将待处理的数据一次性推送给界面，期间暂停重绘，只绘制一帧"""
+        pending = self._pending_updates
+        self._pending_updates = {}
+
+        handlers = self._update_handlers
+        with suspend_updates(self):
+            for key, payload in pending.items():
+                for handler in handlers.get(key, ()):
+                    handler(payload)
+    
+    def init_tab_timers(self):
+        """为需要自动刷新的标签页创建定时器"""
+        refreshers = {
+            'system_monitor': ('system_monitor_interface', self._refresh_sensors),
+            'process': ('process_interface', self.process_controller.get_processes),
+            'network': ('network_interface', self.network_controller.get_connections),
+            'services': ('services_interface', self.refresh_services),
+        }
+
+        for key, (attr, slot) in refreshers.items():
+            interval = self.TAB_REFRESH_INTERVALS[key]
+            timer = QTimer(self)
+            timer.setInterval(interval)
+            timer.timeout.connect(slot)
+            timer.timeout.connect(lambda a=attr: self._on_tab_timer(a))
+            self._tab_timers[attr] = timer
+            self._tab_intervals[attr] = interval
+            self._tab_refreshers[attr] = slot
+
+    def _on_tab_timer(self, attr: str):
+        """
+        定时刷新触发后安排下一次间隔：先按数据无变化退避，收到变化的数据时再复位
+
+        Args:
+            attr: 标签页界面属性名
+        """
+        backoff = self._tab_backoff.get(attr, 1.0) * self.REFRESH_BACKOFF_FACTOR
+        self._tab_backoff[attr] = min(backoff, self.REFRESH_BACKOFF_MAX)
+        self._apply_tab_interval(attr)
+
+    def _reset_backoff(self, attr: str):
+        """
+        复位标签页的刷新退避（数据有变化或用户操作时调用）
+
+        Args:
+            attr: 标签页界面属性名
+        """
+        if self._tab_backoff.get(attr, 1.0) == 1.0:
+            return
+        self._tab_backoff[attr] = 1.0
+        if attr in self._tab_timers:
+            self._apply_tab_interval(attr)
+
+    def _apply_tab_interval(self, attr: str):
+        """按退避倍数设置下一次刷新间隔，并加入±10%抖动避免与其他周期性任务同步采样"""
+        interval = self._tab_intervals[attr] * self._tab_backoff.get(attr, 1.0)
+        self._tab_timers[attr].setInterval(int(interval * random.uniform(0.9, 1.1)))
+
+    def _refresh_sensors(self):
+        """定时刷新温度和电池信息"""
+        self.refresh_temperature()
+        self.refresh_battery()
+
+    def _on_tab_changed(self, index: int, refresh: bool = True):
+        """
+        标签页切换：按需创建界面，并只保留当前标签页的定时刷新
+
+        隐藏标签页的数据不再刷新，切换过来时先立即刷新一次，避免显示过期数据
+
+        Args:
+            index: 当前标签页索引
+            refresh: 是否立即刷新当前标签页的数据
+        """
+        self._ensure_tab(index)
+        current = self.TABS[index][0]
+
+        refresher = self._tab_refreshers.get(current)
+        if refresh and refresher is not None:
+            refresher()
+
+        for attr, timer in self._tab_timers.items():
+            if attr == current:
+                self._reset_backoff(attr)
+                timer.start()
+            else:
+                timer.stop()
 
-        self.traffic_interface.process_traffic_card.refresh_requested.connect(self.refresh_process_traffic)
+        # 流量监控每秒采样，仅在流量标签页可见时运行
+        if current == 'traffic_interface':
+            self.traffic_controller.start_monitoring(interval=1000)
+        else:
+            self.traffic_controller.stop_monitoring()
 
-        self.system_monitor_interface.temperature_card.refresh_requested.connect(self.refresh_temperature)
-        self.system_monitor_interface.battery_card.refresh_requested.connect(self.refresh_battery)
-        self.services_interface.services_card.refresh_requested.connect(self.refresh_services)
-    
     def start_monitoring(self):
         """开始监控"""
-        # 启动系统监控（自动刷新）
+        # 启动系统监控（自动刷新，始终运行）
         self.system_controller.start_monitoring()
 
-        # 启动流量监控（自动刷新）
-        self.traffic_controller.start_monitoring(interval=1000)  # 每1秒更新一次流量
-
-        # 初始加载数据（仅加载一次）
-        QTimer.singleShot(500, self.refresh_processes_once)
-        QTimer.singleShot(1000, self.refresh_network_once)
-
-        # 初始加载高级监控数据
-        QTimer.singleShot(1500, self.refresh_temperature)
-        QTimer.singleShot(1500, self.refresh_battery)
-        QTimer.singleShot(2000, self.refresh_services)
+        # 按当前标签页启动对应的定时刷新
+        self.init_tab_timers()
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        self._on_tab_changed(self.tab_widget.currentIndex(), refresh=False)
+
+        # 初始加载数据（仅加载一次）：在下一次事件循环同时提交，由共享线程池并行执行
+        QTimer.singleShot(0, self._initial_load)
+
+    def _initial_load(self):
+        """同时提交所有初始数据加载，全部到达后在状态栏提示"""
+        self._initial_pending = set(self.INITIAL_DATA_KEYS)
+        self.refresh_processes_once()
+        self.refresh_network_once()
+        self.refresh_temperature()
+        self.refresh_battery()
+        self.refresh_services()
+
+    def _mark_initial_loaded(self, key: str):
+        """
+        记录一项初始数据已到达
+
+        Args:
+            key: 数据键
+        """
+        if key in self._initial_pending:
+            self._initial_pending.discard(key)
+            if not self._initial_pending:
+                self._show_status("初始化完成")
     
     def refresh_processes_once(self):
         """初始加载进程列表（仅一次）"""
@@ -367,29 +698,39 @@ class MainWindow(QMainWindow):
     
     def refresh_current_tab(self):
         """刷新当前标签页"""
-        current_index = self.tab_widget.currentIndex()
-        
-        if current_index == 0:  # 系统信息
-            self.refresh_hardware()
-        elif current_index == 1:  # 进程管理
-            self.refresh_processes()
-        elif current_index == 2:  # 网络监控
-            self.refresh_network()
+        refreshers = {
+            'system_info_interface': self.refresh_hardware,
+            'system_monitor_interface': self._refresh_sensors,
+            'process_interface': self.refresh_processes,
+            'network_interface': self.refresh_network,
+            'traffic_interface': self.refresh_process_traffic,
+            'services_interface': self.refresh_services,
+        }
+        current = self.TABS[self.tab_widget.currentIndex()][0]
+        refreshers[current]()
     
     def refresh_processes(self):
         """刷新进程列表"""
-        self.process_controller.get_processes(force_refresh=True)
-        self.status_bar.showMessage("进程列表已刷新", 2000)
+        if not self._throttle.ready('processes', self.MANUAL_REFRESH_INTERVAL):
+            return
+        self._reset_backoff('process_interface')
+        self._batch.add('processes')
+        self._show_status("进程列表已刷新")
     
     def refresh_network(self):
         """刷新网络连接"""
-        self.network_controller.get_connections(force_refresh=True)
-        self.status_bar.showMessage("网络连接已刷新", 2000)
+        if not self._throttle.ready('network', self.MANUAL_REFRESH_INTERVAL):
+            return
+        self._reset_backoff('network_interface')
+        self._batch.add('network')
+        self._show_status("网络连接已刷新")
     
     def refresh_hardware(self):
         """刷新硬件信息"""
-        self.hardware_controller.get_hardware_info()
-        self.status_bar.showMessage("硬件信息已刷新", 2000)
+        if not self._throttle.ready('hardware', self.MANUAL_REFRESH_INTERVAL):
+            return
+        self._batch.add('hardware')
+        self._show_status("硬件信息已刷新")
 
     def show_hardware_detail(self):
         """显示硬件信息详情对话框"""
@@ -401,6 +742,7 @@ class MainWindow(QMainWindow):
 
         # 获取并显示硬件信息
         hardware_info = self.hardware_controller.get_hardware_info_sync()
+        self._is_changed('hardware', hardware_info)
         dialog.update_hardware_info(hardware_info)
 
         # 显示对话框
@@ -408,8 +750,10 @@ class MainWindow(QMainWindow):
 
     def _refresh_hardware_dialog(self, dialog):
         """刷新硬件信息对话框"""
-        hardware_info = self.hardware_controller.get_hardware_info_sync()
-        dialog.update_hardware_info(hardware_info)
+        hardware_info = self.hardware_controller.get_hardware_info_sync(force_refresh=True)
+        # 硬件信息基本不变，内容相同时不重建对话框内容
+        if self._is_changed('hardware', hardware_info):
+            dialog.update_hardware_info(hardware_info)
     
     def kill_process(self, pid: int, force: bool):
         """结束进程"""
@@ -417,164 +761,102 @@ class MainWindow(QMainWindow):
     
     def on_system_info_updated(self, system_info):
         """系统信息更新"""
-        self.system_info_interface.update_system_info(system_info)
-        self.system_monitor_interface.update_system_info(system_info)
-    
+        self._dispatch('system_info', system_info)
+    
+    def on_process_visibility_changed(self, visible: bool):
+        """进程界面可见性变化"""
+        if visible:
+            # 切换到进程标签页时由 _on_tab_changed 负责刷新，这里只登记，避免重复获取
+            self.process_controller.add_consumer()
+        else:
+            self.process_controller.remove_consumer()
+
+    def on_process_search_changed(self, text: str):
+        """进程搜索文本变化：在后台获取时按名称过滤，再取CPU占用最高的进程"""
+        self.process_controller.set_name_filter(text)
+        self._reset_backoff('process_interface')
+        self._batch.add('processes')
+
+    def on_process_sort_key_changed(self, sort_by: str):
+        """进程表格排序列变化：后台按新的指标选取进程"""
+        self.process_controller.set_sort_key(sort_by)
+        self._reset_backoff('process_interface')
+        self._batch.add('processes')
+
     def on_processes_updated(self, processes):
         """进程列表更新"""
-        self.process_interface.update_processes(processes)
+        self._dispatch('processes', processes)
     
     def on_connections_updated(self, connections):
         """网络连接更新"""
-        self.network_interface.update_connections(connections)
+        self._dispatch('connections', connections)
 
     def on_traffic_updated(self, traffic_data):
         """流量信息更新"""
-        self.traffic_interface.update_traffic(traffic_data)
+        self._dispatch('traffic', traffic_data)
     
     def on_process_traffic_updated(self, traffic_list):
         """进程流量更新"""
-        self.traffic_interface.update_process_traffic(traffic_list)
+        self._dispatch('process_traffic', traffic_list)
 
     def refresh_process_traffic(self):
         """刷新进程流量"""
-        self.traffic_controller.get_process_traffic()
+        if not self._throttle.ready('process_traffic', self.MANUAL_REFRESH_INTERVAL):
+            return
+        self._batch.add('process_traffic')
 
-    # 高级监控信号处理
+    # 高级监控信号处理（先提示单项刷新再分发数据，最后一项初始数据到达时显示的“初始化完成”不会被覆盖）
     def on_temperature_updated(self, temp_info):
         """温度信息更新"""
-        self.system_monitor_interface.update_temperature(temp_info)
+        self._show_status("温度信息已刷新")
+        self._dispatch('temperature', temp_info)
 
     def on_battery_updated(self, battery_info):
         """电池信息更新"""
-        self.system_monitor_interface.update_battery(battery_info)
+        self._show_status("电池信息已刷新")
+        self._dispatch('battery', battery_info)
 
     def on_services_updated(self, services):
         """服务列表更新"""
-        self.services_interface.update_services(services)
+        self._show_status("服务列表已刷新")
+        self._dispatch('services', services)
 
     def refresh_temperature(self):
         """刷新温度信息"""
-        import psutil
-        try:
-            temp_info = {}
-            if hasattr(psutil, 'sensors_temperatures'):
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    for name, entries in temps.items():
-                        temp_list = []
-                        for entry in entries:
-                            temp_data = {
-                                'label': entry.label or name,
-                                'current': entry.current,
-                                'high': entry.high,
-                                'critical': entry.critical
-                            }
-                            temp_list.append(temp_data)
-                        temp_info[name] = temp_list
-                else:
-                    temp_info['error'] = "未检测到温度传感器"
-            else:
-                temp_info['error'] = "当前系统不支持温度监控"
-            self.on_temperature_updated(temp_info)
-            self.status_bar.showMessage("温度信息已刷新", 2000)
-        except Exception as e:
-            self.on_error(f"获取温度信息失败: {str(e)}")
+        self.advanced_controller.get_temperature_info()
 
     def refresh_battery(self):
         """刷新电池信息"""
-        import psutil
-        try:
-            battery_info = {}
-            if hasattr(psutil, 'sensors_battery'):
-                battery = psutil.sensors_battery()
-                if battery:
-                    battery_info = {
-                        'percent': battery.percent,
-                        'power_plugged': battery.power_plugged,
-                        'seconds_left': battery.secsleft if not battery.power_plugged else None,
-                    }
-                    if battery_info['seconds_left'] and battery_info['seconds_left'] != -1:
-                        hours = battery_info['seconds_left'] // 3600
-                        minutes = (battery_info['seconds_left'] % 3600) // 60
-                        battery_info['time_left_formatted'] = f"{hours}小时{minutes}分钟"
-                    else:
-                        battery_info['time_left_formatted'] = "正在充电或无法估算"
-                    battery_info['status'] = "充电中" if battery.power_plugged else "使用电池"
-                else:
-                    battery_info['error'] = "未检测到电池"
-            else:
-                battery_info['error'] = "当前系统不支持电池监控"
-            self.on_battery_updated(battery_info)
-            self.status_bar.showMessage("电池信息已刷新", 2000)
-        except Exception as e:
-            self.on_error(f"获取电池信息失败: {str(e)}")
+        self.advanced_controller.get_battery_info()
 
     def refresh_services(self):
         """刷新服务列表"""
-        import platform
-        try:
-            services = []
-            if platform.system() == 'Windows':
-                try:
-                    import win32service
-                    import win32con
-
-                    hscm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_ENUMERATE_SERVICE)
-                    service_list = win32service.EnumServicesStatus(
-                        hscm,
-                        win32service.SERVICE_WIN32,
-                        win32service.SERVICE_STATE_ALL
-                    )
-                    win32service.CloseServiceHandle(hscm)
-
-                    for service in service_list[:100]:
-                        service_name = service[0]
-                        display_name = service[1]
-                        status_code = service[2][1]
-
-                        status_map = {
-                            win32service.SERVICE_STOPPED: "已停止",
-                            win32service.SERVICE_START_PENDING: "启动中",
-                            win32service.SERVICE_STOP_PENDING: "停止中",
-                            win32service.SERVICE_RUNNING: "运行中",
-                            win32service.SERVICE_CONTINUE_PENDING: "继续中",
-                            win32service.SERVICE_PAUSE_PENDING: "暂停中",
-                            win32service.SERVICE_PAUSED: "已暂停",
-                        }
-
-                        services.append({
-                            'name': service_name,
-                            'display_name': display_name,
-                            'status': status_map.get(status_code, "未知"),
-                            'status_code': status_code
-                        })
-
-                except ImportError:
-                    services = [{'error': '需要安装 pywin32 库'}]
-                except Exception as e:
-                    services = [{'error': f'获取服务失败: {str(e)}'}]
-            else:
-                services = [{'error': '仅支持Windows系统'}]
+        self.advanced_controller.get_services_info()
 
-            self.on_services_updated(services)
-            self.status_bar.showMessage("服务列表已刷新", 2000)
-        except Exception as e:
-            self.on_error(f"获取服务信息失败: {str(e)}")
+    def _show_status(self, message: str):
+        """
+        在状态栏显示临时提示
+
+        Args:
+            message: 提示文本
+        """
+        self._show_message(message, self.STATUS_MESSAGE_TIMEOUT)
 
     def on_process_killed(self, pid: int, message: str):
         """进程结束成功"""
+        # 进程已退出，立即刷新进程列表（不受手动刷新节流限制）
+        self._batch.add('processes')
         show_success_message(self, message)
-        # 刷新进程列表
-        QTimer.singleShot(1000, self.refresh_processes)
     
     def on_error(self, error_message: str):
         """错误处理"""
-        show_error_message(self, error_message)
+        self._error_bus.post(error_message)
     
     def show_about(self):
-        """显示关于对话框"""
-        about_text = f"""系统监控与进程管理工具 v3.2
+        """显示关于对话框（只创建一次；open() 以窗口模态显示，不进入嵌套事件循环）"""
+        if self._about_dialog is None:
+            system, release, python_version, architecture = _PLATFORM_SUMMARY
+            about_text = f"""系统监控与进程管理工具 v3.2
 
 基于PySide6开发的现代化系统监控工具
 
@@ -589,47 +871,97 @@ class MainWindow(QMainWindow):
 • MVC架构设计
 
 系统信息:
-• 操作系统: {platform.system()} {platform.release()}
-• Python版本: {platform.python_version()}
-• 架构: {platform.architecture()[0]}
+• 操作系统: {system} {release}
+• Python版本: {python_version}
+• 架构: {architecture}
 
 开发框架:
 • PySide6
 • psutil"""
-        
-        QMessageBox.about(self, "关于", about_text)
+
+            self._about_dialog = QMessageBox(
+                QMessageBox.Icon.Information, "关于", about_text,
+                QMessageBox.StandardButton.Ok, self
+            )
+
+        if self._about_dialog.isVisible():
+            self._about_dialog.raise_()
+            self._about_dialog.activateWindow()
+        else:
+            self._about_dialog.open()
     
     def center_window(self):
         """将窗口移动到屏幕中央"""
-        screen = QApplication.primaryScreen().geometry()
-        window = self.geometry()
-        x = (screen.width() - window.width()) // 2
-        y = (screen.height() - window.height()) // 2
-        self.move(x, y)
+        frame = self.frameGeometry()
+        frame.moveCenter(QApplication.primaryScreen().availableGeometry().center())
+        self.move(frame.topLeft())
     
     def closeEvent(self, event):
         """关闭事件"""
         try:
-            # 停止监控服务
+            # 先停止所有定时器，不再提交新的后台任务
+            for timer in self._tab_timers.values():
+                timer.stop()
             self.system_controller.stop_monitoring()
             self.traffic_controller.stop_monitoring()
-            
-            # 停止定时器
-            if hasattr(self, 'refresh_timer'):
-                self.refresh_timer.stop()
-            
-            event.accept()
+
+            # 取消排队中的任务，并限时等待正在执行的任务结束
+            for controller in (self.system_controller, self.process_controller,
+                               self.network_controller, self.hardware_controller,
+                               self.traffic_controller, self.advanced_controller):
+                controller.worker_manager.stop_all()
+            if self.process_interface is not None:
+                self.process_interface.process_card.worker_manager.stop_all()
+            if not AsyncWorkerManager.wait_for_done(2000):
+                print("关闭窗口时仍有后台任务未结束，其结果将被丢弃")
         except Exception as e:
             print(f"关闭窗口时出错: {e}")
+        finally:
             event.accept()
 
 
+def _install_signal_wakeup(app: QApplication):
+    """
+    让Python信号处理函数（如Ctrl+C）在Qt事件循环空闲时也能及时执行，无需定时器轮询
+
+    信号到达时解释器向唤醒套接字写入一个字节，QSocketNotifier随即唤醒事件循环
+    回到Python代码，已登记的信号处理函数便会执行
+
+    Args:
+        app: 应用程序实例，负责持有套接字和通知器
+    """
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    try:
+        signal.set_wakeup_fd(wsock.fileno())
+    except ValueError:
+        # 只能在主线程设置
+        rsock.close()
+        wsock.close()
+        return
+
+    def drain():
+        try:
+            rsock.recv(64)
+        except OSError:
+            pass
+
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Type.Read, app)
+    notifier.activated.connect(drain)
+    app._signal_wakeup = (rsock, wsock, notifier)
+
+
 def main():
     """主函数"""
     try:
         # 创建应用程序
         app = QApplication(sys.argv)
-        app.setStyle("windowsvista")
+        _install_signal_wakeup(app)
+
+        # 仅在样式可用时设置（非Windows平台没有windowsvista样式）
+        if "windowsvista" in (key.lower() for key in QStyleFactory.keys()):
+            app.setStyle("windowsvista")
         # 设置应用程序信息
         app.setApplicationName("系统监控工具")
         app.setApplicationVersion("3.0")
@@ -646,7 +978,6 @@ def main():
         
     except Exception as e:
         print(f"启动应用程序时出错: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -5,11 +5,144 @@ UI工具函数和自定义样式组件
 提供消息提示等辅助功能，以及可复用的样式组件
 """
 
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import List, Tuple
 from PySide6.QtWidgets import (
-    QMessageBox, QTableWidget, QPushButton, QGroupBox,
-    QDialog, QScrollArea, QWidget
+    QMessageBox, QTableWidget, QTableWidgetItem, QTableView, QPushButton, QGroupBox,
+    QDialog, QScrollArea, QWidget, QHeaderView
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QSortFilterProxyModel
+
+
+@contextmanager
+def suspend_updates(widget):
+    """
+    在代码块执行期间暂停部件重绘，结束后统一重绘一次
+
+    Args:
+        widget: 要暂停重绘的部件（其子部件一并生效）
+    """
+    was_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(was_enabled)
+
+
+@contextmanager
+def batch_model_update(view: QTableView, proxy: QSortFilterProxyModel = None):
+    """
+    批量更新源模型：暂停视图重绘和代理模型的动态排序过滤，
+    结束后代理模型只重新排序一次，视图只重绘一次
+
+    源模型一次更新会依次发出删除、数据变化、插入等多个信号，
+    不加保护时代理模型每个信号都要重新排序，视图每个信号都要重新布局
+
+    Args:
+        view: 显示该模型的表格视图
+        proxy: 视图使用的排序过滤代理模型（没有代理时为None）
+    """
+    dynamic = proxy is not None and proxy.dynamicSortFilter()
+    with suspend_updates(view):
+        if dynamic:
+            proxy.setDynamicSortFilter(False)
+        try:
+            yield view
+        finally:
+            if dynamic:
+                # 重新开启时代理模型按当前排序列整体排序一次
+                proxy.setDynamicSortFilter(True)
+
+
+@contextmanager
+def bulk_fill(table: QTableWidget):
+    """
+    批量填充QTableWidget：暂停重绘、排序和逐单元格信号，结束后只通知视图一次布局变化
+
+    行数需在进入代码块之前设置好（setRowCount需要正常通知视图）
+
+    Args:
+        table: 要填充的表格
+    """
+    model = table.model()
+    sorting = table.isSortingEnabled()
+    was_enabled = table.updatesEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    model.layoutAboutToBeChanged.emit()
+    model.blockSignals(True)
+    try:
+        yield table
+    finally:
+        model.blockSignals(False)
+        model.layoutChanged.emit()
+        table.blockSignals(False)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(was_enabled)
+
+
+def row_ranges(rows: List[int]) -> List[Tuple[int, int]]:
+    """
+    将升序行号列表合并为连续区间，供模型按区间批量删除行
+
+    Args:
+        rows: 升序行号列表
+
+    Returns:
+        [(first, last), ...]
+    """
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+def set_item_text(table: QTableWidget, row: int, column: int, text: str) -> QTableWidgetItem:
+    """
+    设置单元格文本，已有单元格项时原地复用，只为新增的单元格创建项
+
+    Args:
+        table: 表格
+        row: 行号
+        column: 列号
+        text: 文本
+
+    Returns:
+        单元格项
+    """
+    item = table.item(row, column)
+    if item is None:
+        item = QTableWidgetItem(text)
+        table.setItem(row, column, item)
+    elif item.text() != text:
+        item.setText(text)
+    return item
+
+
+def set_column_widths(table, widths: dict, stretch_columns=()):
+    """
+    设置表格列宽：指定列使用固定的初始宽度（用户仍可拖动调整），其余列按比例拉伸
+
+    不使用 ResizeToContents，数据变化时表头无需测量所有单元格文本
+
+    Args:
+        table: 表格（QTableWidget或QTableView）
+        widths: 列号 -> 初始宽度（像素）
+        stretch_columns: 拉伸填充剩余宽度的列号
+    """
+    header = table.horizontalHeader()
+    for column, width in widths.items():
+        header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+        header.resizeSection(column, width)
+    for column in stretch_columns:
+        header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch)
 
 
 def show_success_message(parent, message: str):
@@ -55,6 +188,160 @@ def show_info_message(parent, message: str):
     msg_box.exec()
 
 
+class ErrorBus(QObject):
+    """
+    错误消息总线：相同错误在抑制时间内只提示一次；
+    同一时间只显示一个错误对话框（非阻塞），对话框打开期间的新错误只更新其内容
+    """
+
+    def __init__(self, parent=None, suppress_seconds: float = 3.0, max_entries: int = 64):
+        """
+        初始化错误消息总线
+
+        Args:
+            parent: 父部件，同时作为错误对话框的父窗口
+            suppress_seconds: 相同错误的抑制时间（秒）
+            max_entries: 记录的错误条数上限
+        """
+        super().__init__(parent)
+        self._parent = parent
+        self._suppress_seconds = suppress_seconds
+        self._max_entries = max_entries
+        self._last_shown = OrderedDict()  # 错误消息 -> 上次显示时间
+        self._box = None  # 当前打开的错误对话框
+
+    def post(self, message: str):
+        """
+        提交错误消息
+
+        Args:
+            message: 错误消息
+        """
+        if self._box is not None:
+            # 已有错误对话框在等待用户确认：显示最新的错误，不再叠加新的对话框
+            if self._box.text() != message:
+                self._box.setText(message)
+            return
+
+        now = time.monotonic()
+        last = self._last_shown.get(message)
+        if last is not None and now - last < self._suppress_seconds:
+            return
+
+        self._remember(message, now)
+
+        # open() 不进入嵌套事件循环，定时刷新在对话框打开期间照常进行
+        box = QMessageBox(QMessageBox.Icon.Critical, "错误", message,
+                          QMessageBox.StandardButton.Ok, self._parent)
+        box.finished.connect(self._on_box_finished)
+        self._box = box
+        box.open()
+
+    def _on_box_finished(self):
+        """错误对话框关闭：之后的错误重新按抑制时间弹出"""
+        box, self._box = self._box, None
+        if box is not None:
+            # 关闭前显示的错误从关闭时起重新计算抑制时间
+            self._remember(box.text(), time.monotonic())
+            box.deleteLater()
+
+    def _remember(self, message: str, now: float):
+        """记录错误消息的显示时间，超出条数上限时丢弃最早的记录"""
+        self._last_shown[message] = now
+        self._last_shown.move_to_end(message)
+        if len(self._last_shown) > self._max_entries:
+            self._last_shown.popitem(last=False)
+
+
+# 表格样式模板，QTableWidget和QTableView共用，导入时生成一次
+_TABLE_STYLE_TEMPLATE = """
+    {table} {{
+        border: 1px solid #c0c0c0;
+        background-color: white;
+        alternate-background-color: #f5f5f5;
+        selection-background-color: #0078d4;
+        selection-color: white;
+        font-size: 9pt;
+        outline: none;
+    }}
+    {table}::item {{
+        padding: 2px 4px;
+        border: none;
+    }}
+    {table}::item:selected {{
+        background-color: #0078d4;
+        color: white;
+    }}
+    QHeaderView::section {{
+        background-color: #f0f0f0;
+        color: #333;
+        padding: 4px;
+        border: none;
+        border-right: 1px solid #d0d0d0;
+        border-bottom: 1px solid #d0d0d0;
+        font-weight: bold;
+        font-size: 9pt;
+    }}
+    {table} QTableCornerButton::section {{
+        background-color: #f0f0f0;
+        border: none;
+    }}
+"""
+
+_TABLE_WIDGET_STYLE = _TABLE_STYLE_TEMPLATE.format(table='QTableWidget')
+_TABLE_VIEW_STYLE = _TABLE_STYLE_TEMPLATE.format(table='QTableView')
+
+_GROUP_BOX_STYLE = """
+    QGroupBox {
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        margin-top: 12px;
+        padding-top: 8px;
+        font-weight: bold;
+        font-size: 10pt;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 4px 0 4px;
+    }
+"""
+
+
+# 按钮样式模板及各按钮类型的颜色：(背景色, 悬停色, 按下色)
+_BUTTON_STYLE_TEMPLATE = """
+    QPushButton {{
+        background-color: {color};
+        color: white;
+        border: none;
+        padding: 6px 16px;
+        border-radius: 3px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {hover_color};
+    }}
+    QPushButton:pressed {{
+        background-color: {pressed_color};
+    }}
+    QPushButton:disabled {{
+        background-color: #cccccc;
+        color: #666666;
+    }}
+"""
+
+_BUTTON_COLORS = {
+    'primary': ("#0078d4", "#106ebe", "#005a9e"),
+    'danger': ("#d83b01", "#a80000", "#8c0000"),
+}
+
+# 按钮类型 -> 样式表，导入时生成一次，所有按钮实例共用
+_BUTTON_STYLES = {
+    button_type: _BUTTON_STYLE_TEMPLATE.format(color=color, hover_color=hover_color, pressed_color=pressed_color)
+    for button_type, (color, hover_color, pressed_color) in _BUTTON_COLORS.items()
+}
+
+
 class StyledTableWidget(QTableWidget):
     """自定义样式表格组件"""
 
@@ -80,39 +367,36 @@ class StyledTableWidget(QTableWidget):
 
     def _apply_styles(self):
         """应用表格样式"""
-        self.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #c0c0c0;
-                background-color: white;
-                alternate-background-color: #f5f5f5;
-                selection-background-color: #0078d4;
-                selection-color: white;
-                font-size: 9pt;
-                outline: none;
-            }
-            QTableWidget::item {
-                padding: 2px 4px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                color: #333;
-                padding: 4px;
-                border: none;
-                border-right: 1px solid #d0d0d0;
-                border-bottom: 1px solid #d0d0d0;
-                font-weight: bold;
-                font-size: 9pt;
-            }
-            QTableWidget QTableCornerButton::section {
-                background-color: #f0f0f0;
-                border: none;
-            }
-        """)
+        self.setStyleSheet(_TABLE_WIDGET_STYLE)
+
+
+class StyledTableView(QTableView):
+    """自定义样式表格视图组件（配合QAbstractTableModel使用）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # 与StyledTableWidget保持一致的表格样式
+        self.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.setAlternatingRowColors(True)
+        self.setShowGrid(False)
+        self.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+
+        # 设置垂直表头（固定行高，视图无需逐行测量即可只绘制可见行）
+        vertical_header = self.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(24)
+
+        # 设置样式
+        self._apply_styles()
+
+    def _apply_styles(self):
+        """应用表格样式"""
+        self.setStyleSheet(_TABLE_VIEW_STYLE)
 
 
 class StyledButton(QPushButton):
@@ -130,37 +414,9 @@ class StyledButton(QPushButton):
 
     def _apply_styles(self):
         """应用按钮样式"""
-        if self.button_type == self.PRIMARY:
-            color = "#0078d4"
-            hover_color = "#106ebe"
-            pressed_color = "#005a9e"
-        elif self.button_type == self.DANGER:
-            color = "#d83b01"
-            hover_color = "#a80000"
-            pressed_color = "#8c0000"
-        else:
-            return
-
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                padding: 6px 16px;
-                border-radius: 3px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton:pressed {{
-                background-color: {pressed_color};
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #666666;
-            }}
-        """)
+        style = _BUTTON_STYLES.get(self.button_type)
+        if style is not None:
+            self.setStyleSheet(style)
 
 
 class StyledGroupBox(QGroupBox):
@@ -172,18 +428,4 @@ class StyledGroupBox(QGroupBox):
 
     def _apply_styles(self):
         """应用分组框样式"""
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                margin-top: 12px;
-                padding-top: 8px;
-                font-weight: bold;
-                font-size: 10pt;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 4px 0 4px;
-            }
-        """)
+        self.setStyleSheet(_GROUP_BOX_STYLE)
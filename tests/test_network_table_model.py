@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+网络连接表格模型的增量更新测试
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("psutil")
+
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+
+from app.models import NetworkConnection  # noqa: E402
+from app.views.cards.network_cards import NetworkTableModel  # noqa: E402
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qt_app():
+    """模型信号需要Qt应用实例"""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    yield app
+
+
+def _rows(model):
+    """按行读取模型显示的连接"""
+    return [
+        tuple(model.data(model.index(row, column)) for column in range(model.columnCount()))
+        for row in range(model.rowCount())
+    ]
+
+
+def test_duplicate_keys_then_incremental_update():
+    """快照中存在标识相同的连接后，下一次更新仍能正确替换全部行"""
+    a = NetworkConnection("TCP", "0.0.0.0:80", "N/A", "LISTEN", None)
+    b = NetworkConnection("UDP", "0.0.0.0:53", "N/A", "N/A", None)
+
+    model = NetworkTableModel()
+    model.set_connections([a, a, b])
+    assert model.rowCount() == 3
+
+    model.set_connections([a, b])
+    assert _rows(model) == [
+        ("TCP", "0.0.0.0:80", "N/A", "LISTEN", "N/A"),
+        ("UDP", "0.0.0.0:53", "N/A", "N/A", "N/A"),
+    ]
+
+
+def test_incremental_update_by_key():
+    """按标识删除已关闭的连接、更新状态变化的连接、追加新连接"""
+    a = NetworkConnection("TCP", "127.0.0.1:5000", "127.0.0.1:6000", "ESTABLISHED", 10)
+    b = NetworkConnection("TCP", "127.0.0.1:5001", "127.0.0.1:6001", "ESTABLISHED", 11)
+    c = NetworkConnection("TCP", "127.0.0.1:5002", "N/A", "LISTEN", 12)
+
+    model = NetworkTableModel()
+    model.set_connections([a, b])
+
+    a_closing = NetworkConnection("TCP", "127.0.0.1:5000", "127.0.0.1:6000", "TIME_WAIT", 10)
+    model.set_connections([a_closing, c])
+    assert [row[3] for row in _rows(model)] == ["TIME_WAIT", "LISTEN"]
+    assert [row[4] for row in _rows(model)] == ["10", "12"]